@@ -0,0 +1,438 @@
+import time
+import numpy as np
+
+from LocalSearch import improve_tour
+from operators import as_generator
+
+# Ant Colony Optimization for TSP-scale graphs.
+# Same model as COMBINEANT.py, generalised from one decision over three edges
+# to whole tours over an n-node graph:
+#   transition weight  tau[i, j]**alpha * eta[i, j]**beta,   eta = 1 / d
+#   evaporation        tau = (1 - rho) * tau
+#   deposit            tau[i, j] += Q / Lk  for every edge of ant k's tour
+
+
+def tour_lengths(distances, tours):
+    # Closed-tour length of every row of `tours`
+    return distances[tours, np.roll(tours, -1, axis=1)].sum(axis=1)
+
+
+def roulette_rows(weights, u):
+    """
+    One roulette draw per row of `weights` (m, n) using the uniforms `u` (m,).
+    The rows' normalised cumulative sums are laid end to end with an offset of
+    one per row, so a single searchsorted call serves every ant.
+    """
+    m, n = weights.shape
+    cum = np.cumsum(weights, axis=1)
+    totals = cum[:, -1:]
+    cum = cum / np.where(totals > 0, totals, 1.0) + np.arange(m)[:, None]
+    choice = np.searchsorted(cum.ravel(), np.arange(m) + u, side="right") - np.arange(m) * n
+    return np.minimum(choice, n - 1)
+
+
+def nearest_neighbours(distances, k):
+    # (n, k) indices of each node's k nearest other nodes, nearest first
+    d = distances.copy()
+    np.fill_diagonal(d, np.inf)
+    near = np.argpartition(d, k - 1, axis=1)[:, :k]
+    order = np.argsort(np.take_along_axis(d, near, axis=1), axis=1, kind="stable")
+    return np.take_along_axis(near, order, axis=1)
+
+
+# =============================================================
+# Tour construction (module level so worker processes can run it)
+# =============================================================
+def _choose_full(choice_info, current, visited, u):
+    # Roulette over every unvisited node: O(n) per ant; u: one uniform per ant
+    weights = choice_info[current]
+    weights[visited] = 0.0
+
+    # Dead ends (no reachable unvisited node): pick uniformly instead
+    stuck = weights.sum(axis=1) <= 0
+    if stuck.any():
+        weights[stuck] = ~visited[stuck]
+
+    nxt = roulette_rows(weights, u)
+    # Float round-off at the end of a row can land on a visited node
+    bad = visited[np.arange(len(current)), nxt]
+    if bad.any():
+        nxt[bad] = np.argmax(weights[bad], axis=1)
+    return nxt
+
+
+def _choose_candidates(choice_info, candidates, current, visited, u):
+    # Roulette over the unvisited candidates only: O(k) per ant
+    cand = candidates[current]                            # (m, k)
+    rows = np.arange(len(current))[:, None]
+    open_ = ~visited[rows, cand]
+    weights = choice_info[current[:, None], cand]
+    weights[~open_] = 0.0
+
+    nxt = np.empty(len(current), dtype=np.intp)
+    ok = weights.sum(axis=1) > 0
+    if ok.any():
+        pick = roulette_rows(weights[ok], u[ok])
+        # Float round-off: fall back to the best open candidate
+        bad = ~open_[ok][np.arange(ok.sum()), pick]
+        pick[bad] = np.argmax(weights[ok][bad], axis=1)
+        nxt[ok] = cand[ok][np.arange(ok.sum()), pick]
+    if not ok.all():
+        nxt[~ok] = _choose_full(choice_info, current[~ok], visited[~ok], u[~ok])
+    return nxt
+
+
+def construct_tours(choice_info, n_ants, candidates=None, rng=None):
+    # All ants advance one step at a time as array operations. Every random
+    # number of the construction is drawn up front: a start node and one
+    # roulette uniform per ant and step.
+    rng = as_generator(rng)
+    m, n = n_ants, len(choice_info)
+    ants = np.arange(m)
+    tours = np.empty((m, n), dtype=np.intp)
+    tours[:, 0] = rng.integers(0, n, m)
+    uniforms = rng.random((n, m))
+    visited = np.zeros((m, n), dtype=bool)
+    visited[ants, tours[:, 0]] = True
+
+    for step in range(1, n):
+        current = tours[:, step - 1]
+        if candidates is None:
+            nxt = _choose_full(choice_info, current, visited, uniforms[step])
+        else:
+            nxt = _choose_candidates(choice_info, candidates, current, visited, uniforms[step])
+        tours[:, step] = nxt
+        visited[ants, nxt] = True
+    return tours
+
+
+# ---- Worker side of parallel construction ----
+# The pool initializer attaches the shared choice_info / distance matrices
+# once per worker; each task then only carries an ant count and its own
+# Generator (spawned from the colony's), and only the tours and their
+# lengths travel back.
+_worker = {}
+
+
+def _init_construction_worker(choice_name, dist_name, n_nodes, candidates):
+    from multiprocessing import shared_memory
+    blocks = [shared_memory.SharedMemory(name=name) for name in (choice_name, dist_name)]
+    _worker["blocks"] = blocks
+    _worker["choice_info"] = np.ndarray((n_nodes, n_nodes), dtype=np.float64, buffer=blocks[0].buf)
+    _worker["distances"] = np.ndarray((n_nodes, n_nodes), dtype=np.float64, buffer=blocks[1].buf)
+    _worker["candidates"] = candidates
+
+
+def _construct_chunk(n_ants, rng):
+    tours = construct_tours(_worker["choice_info"], n_ants, _worker["candidates"], rng)
+    return tours, tour_lengths(_worker["distances"], tours)
+
+
+def _shared_copy(array):
+    # Copy `array` into a new shared memory block; returns (block, view)
+    from multiprocessing import shared_memory
+    block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    view = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+    view[...] = array
+    return block, view
+
+
+# Ant Colony Optimizer
+class AntColonyOptimizer:
+    def __init__(self, distances, n_ants=20, max_iter=100, alpha=1.0, beta=1.0, rho=0.5, Q=1.0, tau0=1.0,
+                 n_candidates=None, policy=None, n_workers=None, local_search=None, n_local=1,
+                 n_neighbours=10, rng=None):
+        self.distances = np.asarray(distances, dtype=float)
+        self.n_nodes = len(self.distances)
+        self.n_ants = n_ants
+        self.max_iter = max_iter
+
+        # Parameters
+        self.alpha = alpha    # pheromone influence
+        self.beta = beta      # heuristic influence
+        self.rho = rho        # evaporation rate
+        self.Q = Q            # deposit constant
+
+        # Heuristic (eta = 1/d; 0 on the diagonal / missing edges); eta**beta
+        # never changes, so it is computed once
+        with np.errstate(divide="ignore"):
+            self.eta = np.where(self.distances > 0, 1.0 / self.distances, 0.0)
+        np.fill_diagonal(self.eta, 0.0)
+        self.eta_beta = self.eta ** self.beta
+
+        # Pheromone with lazy evaporation: tau = tau_scale * tau_raw, so
+        # evaporating only shrinks the scalar. choice_info caches
+        # tau_raw**alpha * eta_beta, which differs from tau**alpha * eta**beta
+        # by the global factor tau_scale**alpha that cancels in the roulette;
+        # deposits refresh it on the touched edges only.
+        self.tau_scale = 1.0
+        self.tau_raw = np.full((self.n_nodes, self.n_nodes), float(tau0))
+        self.choice_info = (self.tau_raw ** self.alpha) * self.eta_beta
+        self.symmetric = np.allclose(self.distances, self.distances.T)
+
+        # Candidate lists: the n_candidates nearest neighbours of each node,
+        # nearest first. Ants sample among unvisited candidates and fall back
+        # to the full node set only when all of them are visited.
+        self.candidates = None
+        if n_candidates is not None and n_candidates < self.n_nodes - 1:
+            self.candidates = nearest_neighbours(self.distances, n_candidates)
+
+        # Pheromone update policy (see below); a name or a policy object
+        if policy is None or isinstance(policy, str):
+            policy = POLICIES[policy or "evaporation"]()
+        self.policy = policy
+
+        # rng: numpy.random.Generator (or seed) for tour construction;
+        # parallel workers get streams spawned from it
+        self.rng = as_generator(rng)
+
+        self.best_tour = None
+        self.best_length = float("inf")
+
+        # Optional hybrid stage: the n_local shortest tours of each iteration
+        # are improved with 2-opt and/or Or-opt (local_search is "2opt",
+        # "oropt", "2opt+oropt" or True for both) before the pheromone update,
+        # so the improved tours are the ones that deposit. The moves search
+        # the candidate lists, or n_neighbours nearest neighbours without them.
+        if local_search is True:
+            local_search = "2opt+oropt"
+        self.local_search = tuple(local_search.split("+")) if local_search else ()
+        self.n_local = n_local
+        self.neighbours = None
+        if self.local_search:
+            if not self.symmetric:
+                raise ValueError("local search needs a symmetric distance matrix")
+            self.neighbours = self.candidates
+            if self.neighbours is None:
+                self.neighbours = nearest_neighbours(self.distances, min(n_neighbours, self.n_nodes - 1))
+
+        # Wall time (seconds) accumulated per phase across step() calls
+        self.timings = {"construction": 0.0, "local_search": 0.0, "pheromone": 0.0}
+
+        # Parallel construction: with n_workers > 1 the ants are split across
+        # a process pool. distances and choice_info then live in shared
+        # memory, published once when the pool starts; choice_info is always
+        # updated in place, so workers see every pheromone update without
+        # re-sending the matrix. Call close() (or use a `with` block) to stop
+        # the workers; the colony stays usable afterwards.
+        self.n_workers = n_workers or 1
+        self._pool = None
+        self._blocks = []
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        if self._blocks:
+            # Move the matrices out of shared memory before it is released
+            self.distances = np.array(self.distances)
+            self.choice_info = np.array(self.choice_info)
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def tau(self):
+        # Materialised pheromone matrix (O(n^2); for inspection and reporting)
+        return self.tau_scale * self.tau_raw
+
+    def transition_weights(self, current):
+        # tau**alpha * eta**beta (up to a common factor) for the ants' current rows
+        return self.choice_info[current]
+
+    def construct_tours(self):
+        if self.n_workers <= 1:
+            tours = construct_tours(self.choice_info, self.n_ants, self.candidates, self.rng)
+            return tours, tour_lengths(self.distances, tours)
+
+        if self._pool is None:
+            dist_block, self.distances = _shared_copy(self.distances)
+            choice_block, self.choice_info = _shared_copy(self.choice_info)
+            self._blocks = [choice_block, dist_block]
+            # Imported here so serial / batch workers never pay for it
+            from concurrent.futures import ProcessPoolExecutor
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.n_workers, initializer=_init_construction_worker,
+                initargs=(self._blocks[0].name, self._blocks[1].name, self.n_nodes, self.candidates))
+        # One chunk of ants per worker, each on an independent stream spawned
+        # from the colony's Generator (reproducible for a fixed n_workers)
+        chunks = [len(c) for c in np.array_split(np.arange(self.n_ants), self.n_workers) if len(c)]
+        results = list(self._pool.map(_construct_chunk, chunks, self.rng.spawn(len(chunks))))
+        return np.concatenate([t for t, _ in results]), np.concatenate([l for _, l in results])
+
+    # ---- Pheromone kernels shared by all update policies ----
+    def _refresh_choice_info(self):
+        # In place, so a shared-memory choice_info stays shared
+        np.multiply(self.tau_raw ** self.alpha, self.eta_beta, out=self.choice_info)
+
+    def evaporate(self):
+        # O(1): fold (1 - rho) into the global scale. Renormalise (O(n^2))
+        # before tau_raw**alpha, which grows like tau_scale**-alpha, can
+        # overflow: once tau_scale**alpha drops below 1e-100.
+        self.tau_scale *= (1 - self.rho)
+        if self.tau_scale < 1e-100 ** (1 / max(self.alpha, 1.0)):
+            self.tau_raw *= self.tau_scale
+            self.tau_scale = 1.0
+            self._refresh_choice_info()
+
+    def deposit(self, src, dst, amount):
+        # Add `amount` of true pheromone on edges src->dst (repeats allowed)
+        # and refresh choice_info on those edges only
+        np.add.at(self.tau_raw, (src, dst), amount / self.tau_scale)
+        self.choice_info[src, dst] = (self.tau_raw[src, dst] ** self.alpha) * self.eta_beta[src, dst]
+
+    def deposit_tours(self, tours, amounts):
+        # amounts[k] on every edge of closed tour k (mirrored if symmetric)
+        tours = np.atleast_2d(tours)
+        deposit = np.repeat(np.broadcast_to(amounts, len(tours)), tours.shape[1])
+        src, dst = tours.ravel(), np.roll(tours, -1, axis=1).ravel()
+        if self.symmetric:
+            src, dst, deposit = np.concatenate((src, dst)), np.concatenate((dst, src)), np.tile(deposit, 2)
+        self.deposit(src, dst, deposit)
+
+    def clamp_pheromone(self, tau_min, tau_max):
+        # Bound every edge to [tau_min, tau_max]; O(n^2), used by MAX-MIN AS
+        np.clip(self.tau_raw, tau_min / self.tau_scale, tau_max / self.tau_scale, out=self.tau_raw)
+        self._refresh_choice_info()
+
+    def update_pheromone(self, tours, lengths):
+        self.policy.update(self, tours, lengths)
+
+    def step(self):
+        # One colony iteration: build tours, improve the best few, track the
+        # best, update pheromone
+        t0 = time.perf_counter()
+        tours, lengths = self.construct_tours()
+        t1 = time.perf_counter()
+        if self.local_search:
+            self.improve_tours(tours, lengths)
+        t2 = time.perf_counter()
+
+        best = np.argmin(lengths)
+        if lengths[best] < self.best_length:
+            self.best_length = lengths[best]
+            self.best_tour = tours[best].copy()
+
+        self.update_pheromone(tours, lengths)
+        t3 = time.perf_counter()
+        self.timings["construction"] += t1 - t0
+        self.timings["local_search"] += t2 - t1
+        self.timings["pheromone"] += t3 - t2
+        return tours, lengths
+
+    def improve_tours(self, tours, lengths):
+        # Local search on the n_local shortest tours, in place
+        top = np.argpartition(lengths, min(self.n_local, len(lengths)) - 1)[:self.n_local]
+        for k in top:
+            tours[k], lengths[k] = improve_tour(tours[k], self.distances, self.neighbours, self.local_search)
+
+    def optimize(self):
+        for iteration in range(self.max_iter):
+            self.step()
+            print(f"Iteration {iteration+1}/{self.max_iter}, Best Length: {self.best_length:.6f}")
+
+        return self.best_tour, self.best_length
+
+
+# =============================================================
+# Pheromone update policies
+# =============================================================
+# Each policy implements update(aco, tours, lengths) on top of the engine's
+# evaporate / deposit_tours / clamp_pheromone kernels. aco.best_tour and
+# aco.best_length already include the current iteration when it is called.
+
+class NoEvaporation:
+    # tau = tau + sum_k Q / Lk
+    def update(self, aco, tours, lengths):
+        aco.deposit_tours(tours, aco.Q / lengths)
+
+
+class Evaporation:
+    # Ant System: tau = (1 - rho) * tau + sum_k Q / Lk
+    def update(self, aco, tours, lengths):
+        aco.evaporate()
+        aco.deposit_tours(tours, aco.Q / lengths)
+
+
+class ElitistAS:
+    # Ant System plus `weight` extra ants on the best-so-far tour
+    # (weight defaults to the number of ants)
+    def __init__(self, weight=None):
+        self.weight = weight
+
+    def update(self, aco, tours, lengths):
+        aco.evaporate()
+        aco.deposit_tours(tours, aco.Q / lengths)
+        weight = aco.n_ants if self.weight is None else self.weight
+        aco.deposit_tours(aco.best_tour, weight * aco.Q / aco.best_length)
+
+
+class RankBasedAS:
+    # AS_rank: the r-th best of the (w - 1) best ants deposits (w - r) * Q / Lr,
+    # and the best-so-far tour deposits w * Q / L_best
+    def __init__(self, w=6):
+        self.w = w
+
+    def update(self, aco, tours, lengths):
+        aco.evaporate()
+        n_rank = min(self.w - 1, len(lengths))
+        ranked = np.argsort(lengths, kind="stable")[:n_rank]
+        aco.deposit_tours(tours[ranked], (self.w - np.arange(1, n_rank + 1)) * aco.Q / lengths[ranked])
+        aco.deposit_tours(aco.best_tour, self.w * aco.Q / aco.best_length)
+
+
+class MaxMinAS:
+    """
+    MAX-MIN Ant System: only the iteration-best ant (or the best-so-far tour
+    with best_so_far=True) deposits, and tau is kept in [tau_min, tau_max].
+    Unset bounds follow the usual rule tau_max = Q / (rho * L_best),
+    tau_min = tau_max / (2n). The clamp touches every edge, so this policy
+    costs O(n^2) per iteration.
+    """
+    def __init__(self, tau_min=None, tau_max=None, best_so_far=False):
+        self.tau_min = tau_min
+        self.tau_max = tau_max
+        self.best_so_far = best_so_far
+
+    def update(self, aco, tours, lengths):
+        aco.evaporate()
+        if self.best_so_far:
+            aco.deposit_tours(aco.best_tour, aco.Q / aco.best_length)
+        else:
+            best = np.argmin(lengths)
+            aco.deposit_tours(tours[best], aco.Q / lengths[best])
+        tau_max = self.tau_max if self.tau_max is not None else aco.Q / (aco.rho * aco.best_length)
+        tau_min = self.tau_min if self.tau_min is not None else tau_max / (2 * aco.n_nodes)
+        aco.clamp_pheromone(tau_min, tau_max)
+
+
+POLICIES = {
+    "none": NoEvaporation,
+    "evaporation": Evaporation,
+    "elitist": ElitistAS,
+    "rank": RankBasedAS,
+    "mmas": MaxMinAS,
+}
+
+
+def random_euclidean_graph(n_nodes, seed=None):
+    # Distance matrix of n random cities in the unit square
+    points = np.random.default_rng(seed).random((n_nodes, 2))
+    return np.linalg.norm(points[:, None, :] - points[None, :, :], axis=-1)
+
+
+# Main function
+if __name__ == "__main__":
+    distances = random_euclidean_graph(100, seed=42)
+    aco = AntColonyOptimizer(distances, n_ants=50, max_iter=100, alpha=1.0, beta=3.0, rho=0.1, rng=0)
+    best_tour, best_length = aco.optimize()
+
+    print("\nBest Tour:", best_tour)
+    print("Best Length:", best_length)
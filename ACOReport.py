@@ -0,0 +1,92 @@
+import os
+
+# Reporting for ACO runs. The computation modules (ACO.py, COMBINEANT.py)
+# import NumPy only; pandas and matplotlib are imported here, lazily, the
+# first time a table or figure is requested. Figures are rendered with the
+# non-interactive Agg backend and written to files, never shown.
+
+STEP_COLUMNS = {
+    "init_tau": "tau",
+    "delta_from_3_ants": "delta_tau",
+    "tau_after_update": "tau_updated",
+    "eta (1/d)": "eta",
+    "numerator": "numerators",
+    "probability": "probabilities",
+}
+
+
+def _pyplot():
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def step_table(step, paths):
+    # pandas DataFrame of one COMBINEANT.aco_step() result
+    import pandas as pd
+    return pd.DataFrame({"path": paths, **{name: step[key] for name, key in STEP_COLUMNS.items()}})
+
+
+def plot_step(step, paths, out_dir):
+    """
+    Writes the two figures of one COMBINEANT.aco_step() result into out_dir:
+    pheromone.png (initial pheromone, deposits, updated pheromone) and
+    probabilities.png (transition probabilities for the 4th ant).
+    Returns the written file paths.
+    """
+    plt = _pyplot()
+    os.makedirs(out_dir, exist_ok=True)
+    suffix = f" (policy: {step['policy']})"
+
+    # --- Figure 1: pheromones and deposits (grouped bar chart) ---
+    x = range(len(paths))
+    width = 0.25
+
+    fig1, ax1 = plt.subplots(figsize=(7,4))
+    ax1.bar([p - width for p in x], step["tau"], width, label='init_tau')
+    ax1.bar(x, step["delta_tau"], width, label='delta_from_3_ants')
+    ax1.bar([p + width for p in x], step["tau_updated"], width, label='tau_after_update')
+    ax1.set_xticks(x)
+    ax1.set_xticklabels(paths)
+    ax1.set_ylabel("Pheromone / Deposit value")
+    ax1.set_title("Initial pheromone, deposits from 3 ants, and updated pheromone" + suffix)
+    ax1.legend()
+    fig1.tight_layout()
+
+    # --- Figure 2: probabilities for 4th ant ---
+    fig2, ax2 = plt.subplots(figsize=(7,3))
+    bars = ax2.bar(paths, step["probabilities"])
+    ax2.set_ylabel("Probability")
+    ax2.set_title("Transition probabilities for 4th ant" + suffix)
+    # annotate probability values above bars
+    for rect, prob in zip(bars, step["probabilities"]):
+        height = rect.get_height()
+        ax2.annotate(f"{prob:.3f}", xy=(rect.get_x() + rect.get_width() / 2, height),
+                     xytext=(0, 3), textcoords="offset points", ha="center", va="bottom", fontsize=9)
+    # mark chosen path
+    ax2.text(0.95, 0.85, f"Random draw r={step['r']:.4f}\nChosen: {paths[step['chosen_index']]}", transform=ax2.transAxes,
+             ha="right", va="top", bbox=dict(boxstyle="round", fc="wheat", alpha=0.5))
+    fig2.tight_layout()
+
+    written = []
+    for fig, name in ((fig1, "pheromone.png"), (fig2, "probabilities.png")):
+        path = os.path.join(out_dir, name)
+        fig.savefig(path)
+        plt.close(fig)
+        written.append(path)
+    return written
+
+
+def plot_convergence(best_lengths, path):
+    # Best tour length per iteration (e.g. collected from AntColonyOptimizer.step())
+    plt = _pyplot()
+    fig, ax = plt.subplots(figsize=(7,4))
+    ax.plot(range(1, len(best_lengths) + 1), best_lengths)
+    ax.set_xlabel("Iteration")
+    ax.set_ylabel("Best tour length")
+    ax.set_title("ACO convergence")
+    fig.tight_layout()
+    fig.savefig(path)
+    plt.close(fig)
+    return path
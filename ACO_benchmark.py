@@ -0,0 +1,89 @@
+import sys
+import time
+import numpy as np
+from ACO import AntColonyOptimizer, POLICIES, random_euclidean_graph
+
+# Benchmarks:
+#   python ACO_benchmark.py [n1 n2 ...]
+#       time per colony iteration (tour construction + pheromone update)
+#       against graph size, with and without k-nearest-neighbour candidate lists
+#   python ACO_benchmark.py policies [n]
+#       pheromone update policies compared on identical graphs and seeds
+#   python ACO_benchmark.py local [n]
+#       local-search stages compared, with construction / local-search time
+#   python ACO_benchmark.py long [n]
+#       long runs with a large alpha; fails on any float overflow, i.e. when
+#       the lazy evaporation scale is not renormalised in time
+
+
+def time_iteration(distances, n_candidates, n_ants=20, repeats=2, rng=0):
+    aco = AntColonyOptimizer(distances, n_ants=n_ants, alpha=1.0, beta=3.0, rho=0.1, n_candidates=n_candidates,
+                             rng=rng)
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        tours, lengths = aco.construct_tours()
+        aco.update_pheromone(tours, lengths)
+        best = min(best, time.perf_counter() - start)
+    return best, lengths.min()
+
+
+def compare_policies(n, n_iter=50, seeds=(0, 1, 2)):
+    print(f"{'policy':>12} | {'mean best len':>13} | {'s / iteration':>13}")
+    for name in POLICIES:
+        lengths, elapsed = [], 0.0
+        for seed in seeds:
+            aco = AntColonyOptimizer(random_euclidean_graph(n, seed=seed), n_ants=20, alpha=1.0, beta=3.0,
+                                     rho=0.1, n_candidates=20, policy=name, rng=seed)
+            start = time.perf_counter()
+            for _ in range(n_iter):
+                aco.step()
+            elapsed += time.perf_counter() - start
+            lengths.append(aco.best_length)
+        print(f"{name:>12} | {np.mean(lengths):13.4f} | {elapsed / (n_iter * len(seeds)):13.4f}")
+
+
+def compare_local_search(n, n_iter=30, seed=0, n_local=3):
+    print(f"{'local search':>12} | {'best len':>9} | {'construct (s)':>13} | {'local (s)':>9}")
+    for local_search in (None, "2opt", "oropt", "2opt+oropt"):
+        aco = AntColonyOptimizer(random_euclidean_graph(n, seed=seed), n_ants=20, alpha=1.0, beta=3.0,
+                                 rho=0.1, n_candidates=20, policy="mmas", local_search=local_search,
+                                 n_local=n_local, rng=seed)
+        for _ in range(n_iter):
+            aco.step()
+        print(f"{local_search or 'none':>12} | {aco.best_length:9.4f} | "
+              f"{aco.timings['construction']:13.3f} | {aco.timings['local_search']:9.3f}")
+
+
+def check_long_run(n, n_iter=1000, alphas=(2.0, 4.0, 8.0), rho=0.5, seed=0):
+    print(f"{'policy':>12} | {'alpha':>5} | {'best len':>9}")
+    for name in POLICIES:
+        for alpha in alphas:
+            aco = AntColonyOptimizer(random_euclidean_graph(n, seed=seed), n_ants=10, alpha=alpha, beta=2.0,
+                                     rho=rho, policy=name, rng=seed)
+            with np.errstate(over="raise", invalid="raise"):
+                for _ in range(n_iter):
+                    aco.step()
+            assert np.isfinite(aco.choice_info).all(), (name, alpha)
+            print(f"{name:>12} | {alpha:5.1f} | {aco.best_length:9.4f}")
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["policies"]:
+        compare_policies(int(sys.argv[2]) if len(sys.argv) > 2 else 200)
+        sys.exit()
+    if sys.argv[1:2] == ["local"]:
+        compare_local_search(int(sys.argv[2]) if len(sys.argv) > 2 else 200)
+        sys.exit()
+    if sys.argv[1:2] == ["long"]:
+        check_long_run(int(sys.argv[2]) if len(sys.argv) > 2 else 30)
+        sys.exit()
+
+    sizes = [int(n) for n in sys.argv[1:]] or [250, 500, 1000, 2000]
+    k = 20
+    print(f"{'n':>6} | {'full (s)':>9} | {f'k={k} (s)':>9} | speed-up | {'full len':>9} | {f'k={k} len':>9}")
+    for n in sizes:
+        distances = random_euclidean_graph(n, seed=n)
+        t_full, len_full = time_iteration(distances, None)
+        t_cand, len_cand = time_iteration(distances, k)
+        print(f"{n:6d} | {t_full:9.3f} | {t_cand:9.3f} | {t_full / t_cand:7.1f}x | {len_full:9.3f} | {len_cand:9.3f}")
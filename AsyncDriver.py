@@ -0,0 +1,68 @@
+import asyncio
+import inspect
+import time
+import numpy as np
+
+# asyncio driver for the ask/tell interface of the Optimizer.py optimizers
+# (GreyWolfOptimizer, ParticleSwarmOptimizer, RealCodedGA). Each iteration
+# the optimizer's candidates are sent to `evaluate` with at most
+# max_in_flight evaluations outstanding; the event loop stays free for other
+# work while they run.
+#
+# evaluate may be
+#   - a coroutine function, evaluate(rows) -> score(s), e.g. a request to an
+#     evaluation service or an asyncio subprocess;
+#   - a plain function, run in `executor` (a concurrent.futures executor, or
+#     the loop's default thread pool when None).
+# With chunk_size=1 it receives one position and returns one score; with a
+# larger chunk_size it receives a (k, dim) matrix and returns k scores.
+
+
+async def evaluate_batch(evaluate, candidates, max_in_flight=8, chunk_size=1, executor=None):
+    """Scores the rows of `candidates`, keeping at most max_in_flight calls outstanding."""
+    loop = asyncio.get_running_loop()
+    limit = asyncio.Semaphore(max_in_flight)
+    is_async = inspect.iscoroutinefunction(evaluate)
+
+    async def run(chunk):
+        arg = chunk[0] if chunk_size == 1 else chunk
+        async with limit:
+            if is_async:
+                return await evaluate(arg)
+            return await loop.run_in_executor(executor, evaluate, arg)
+
+    chunks = [candidates[start:start + chunk_size] for start in range(0, len(candidates), chunk_size)]
+    results = await asyncio.gather(*(run(chunk) for chunk in chunks))
+    return np.concatenate([np.atleast_1d(np.asarray(r, dtype=float)) for r in results])
+
+
+async def optimize_async(optimizer, evaluate, max_in_flight=8, chunk_size=1, executor=None):
+    """
+    Runs optimizer (any Optimizer.py PopulationOptimizer: GWO, PSO or
+    RealCodedGA) to the end through ask()/tell(), with its usual reporting,
+    termination and checkpointing. Returns what optimizer.optimize() would.
+    """
+    optimizer.begin_run()
+    for iteration in range(optimizer.n_iter, optimizer.max_iter):
+        scores = await evaluate_batch(evaluate, optimizer.ask(), max_in_flight, chunk_size, executor)
+        optimizer.tell(scores, iteration)
+        if optimizer.end_iteration(iteration):
+            break
+    return optimizer.result()
+
+
+# ---- Example ----
+if __name__ == "__main__":
+    from PSO import ParticleSwarmOptimizer, rosenbrock
+
+    async def remote_score(position):
+        # Stand-in for a call to an evaluation service: 5 ms of latency
+        await asyncio.sleep(0.005)
+        return rosenbrock(position)
+
+    pso = ParticleSwarmOptimizer(rosenbrock, 5, (-10, 10), n_particles=40, max_iter=50, rng=0)
+    start = time.perf_counter()
+    best_position, best_score = asyncio.run(optimize_async(pso, remote_score, max_in_flight=16))
+    print("\nBest Position:", best_position)
+    print("Best (Global) Fitness:", best_score)
+    print(f"{pso.n_iter * pso.n_particles} evaluations in {time.perf_counter() - start:.2f} s")
@@ -0,0 +1,157 @@
+import numpy as np
+from operators import as_generator
+
+
+# =============================================================
+# Packed-bit population
+# =============================================================
+class BitPopulation:
+    """
+    N binary chromosomes of n_bits genes, stored as a packed uint8 matrix of
+    shape (N, ceil(n_bits / 8)). Gene j of row r is the bit
+    (data[r, j // 8] >> (7 - j % 8)) & 1, i.e. np.packbits order. Padding
+    bits in the last byte are always zero.
+    """
+    def __init__(self, data, n_bits):
+        self.data = np.ascontiguousarray(data, dtype=np.uint8)
+        self.n_bits = n_bits
+
+    @classmethod
+    def random(cls, n, n_bits, rng=None):
+        rng = as_generator(rng)
+        return cls.from_bits(rng.random((n, n_bits)) < 0.5)
+
+    @classmethod
+    def from_bits(cls, bits):
+        bits = np.asarray(bits, dtype=bool)
+        return cls(np.packbits(bits, axis=1), bits.shape[1])
+
+    @classmethod
+    def from_strings(cls, chromosomes):
+        codes = np.frombuffer("".join(chromosomes).encode(), dtype=np.uint8)
+        return cls.from_bits((codes == ord("1")).reshape(len(chromosomes), -1))
+
+    def bits(self):
+        return np.unpackbits(self.data, axis=1, count=self.n_bits).astype(bool)
+
+    def to_strings(self):
+        codes = np.where(self.bits(), ord("1"), ord("0")).astype(np.uint8)
+        return [row.tobytes().decode() for row in codes]
+
+    def popcount(self):
+        # Number of 1-genes per chromosome
+        return np.unpackbits(self.data, axis=1).sum(axis=1)
+
+    def copy(self):
+        return BitPopulation(self.data.copy(), self.n_bits)
+
+    def __len__(self):
+        return len(self.data)
+
+    def __getitem__(self, index):
+        return BitPopulation(self.data[np.atleast_1d(np.arange(len(self))[index])], self.n_bits)
+
+
+# ---- Mask helpers (all return packed uint8 masks of shape (N, n_bytes)) ----
+def _suffix_mask(points, n_bytes):
+    # Bits j >= point set, built byte-wise without unpacking
+    shift = np.clip(points[:, None] - 8 * np.arange(n_bytes)[None, :], 0, 8)
+    return (0xFF >> shift).astype(np.uint8)
+
+
+def _pad_mask(n_bits, n_bytes):
+    # Valid (non-padding) bits of one row
+    return np.packbits(np.ones(n_bits, dtype=bool), axis=0)[:n_bytes]
+
+
+def _swap(a, b, mask):
+    # Exchange the masked genes of a and b
+    diff = (a.data ^ b.data) & mask
+    return BitPopulation(a.data ^ diff, a.n_bits), BitPopulation(b.data ^ diff, b.n_bits)
+
+
+# =============================================================
+# Crossover kernels (row i of a is paired with row i of b)
+# =============================================================
+def single_point_crossover(a, b, rng=None):
+    rng = as_generator(rng)
+    points = rng.integers(1, a.n_bits - 2, len(a), endpoint=True)
+    return _swap(a, b, _suffix_mask(points, a.data.shape[1]))
+
+
+def two_point_crossover(a, b, rng=None):
+    rng = as_generator(rng)
+    n_bytes = a.data.shape[1]
+    # Same ranges as Crossover.py: point1 in [1, n-3], point2 in [point1+1, n-2]
+    point1 = rng.integers(1, a.n_bits - 3, len(a), endpoint=True)
+    point2 = point1 + 1 + (rng.random(len(a)) * (a.n_bits - 2 - point1)).astype(int)
+    mask = _suffix_mask(point1, n_bytes) ^ _suffix_mask(point2, n_bytes)
+    return _swap(a, b, mask)
+
+
+def uniform_crossover(a, b, rng=None):
+    rng = as_generator(rng)
+    n_bytes = a.data.shape[1]
+    mask = rng.integers(0, 256, a.data.shape, dtype=np.uint8) & _pad_mask(a.n_bits, n_bytes)
+    return _swap(a, b, mask)
+
+
+def half_uniform_crossover(a, b, rng=None):
+    # HUX: swap exactly half (rounded down) of the differing genes of each pair
+    rng = as_generator(rng)
+    differ = np.unpackbits(a.data ^ b.data, axis=1, count=a.n_bits).astype(bool)
+    keys = np.where(differ, rng.random(differ.shape), 2.0)
+    # The half smallest random keys among the differing genes get swapped
+    half = differ.sum(axis=1) // 2
+    threshold = np.take_along_axis(np.sort(keys, axis=1), np.maximum(half - 1, 0)[:, None], axis=1)
+    mask = (keys <= threshold) & (half > 0)[:, None]
+    return _swap(a, b, np.packbits(mask, axis=1))
+
+
+# =============================================================
+# Mutation kernels
+# =============================================================
+def flip_mutation(pop, rate=0.1, rng=None):
+    rng = as_generator(rng)
+    flips = np.packbits(rng.random((len(pop), pop.n_bits)) < rate, axis=1)
+    return BitPopulation(pop.data ^ flips, pop.n_bits)
+
+
+def _gene_address(positions):
+    return positions >> 3, (1 << (7 - (positions & 7))).astype(np.uint8)
+
+
+def swap_mutation(pop, rng=None):
+    # Interchange two distinct genes per chromosome (XOR both when they differ)
+    rng = as_generator(rng)
+    rows = np.arange(len(pop))
+    i = rng.integers(0, pop.n_bits, len(pop))
+    j = (i + rng.integers(1, pop.n_bits, len(pop))) % pop.n_bits
+    (byte_i, bit_i), (byte_j, bit_j) = _gene_address(i), _gene_address(j)
+    data = pop.data.copy()
+    differ = ((data[rows, byte_i] & bit_i) > 0) != ((data[rows, byte_j] & bit_j) > 0)
+    data[rows, byte_i] ^= bit_i * differ
+    data[rows, byte_j] ^= bit_j * differ
+    return BitPopulation(data, pop.n_bits)
+
+
+def reverse_mutation(pop, rng=None):
+    # Reverse the segment [i, j) of each chromosome
+    rng = as_generator(rng)
+    first = rng.integers(0, pop.n_bits, len(pop))
+    second = (first + rng.integers(1, pop.n_bits, len(pop))) % pop.n_bits
+    i, j = np.minimum(first, second)[:, None], np.maximum(first, second)[:, None]
+    k = np.arange(pop.n_bits)[None, :]
+    index = np.where((k >= i) & (k < j), i + j - 1 - k, k)
+    bits = np.take_along_axis(pop.bits(), index, axis=1)
+    return BitPopulation.from_bits(bits)
+
+
+# ---- String adapter for the demos ----
+def crossover_strings(kernel, p1, p2, rng=None):
+    c1, c2 = kernel(BitPopulation.from_strings([p1]), BitPopulation.from_strings([p2]), rng)
+    return c1.to_strings()[0], c2.to_strings()[0]
+
+
+def mutate_string(kernel, chromosome, *args, rng=None):
+    return kernel(BitPopulation.from_strings([chromosome]), *args, rng=rng).to_strings()[0]
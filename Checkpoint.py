@@ -0,0 +1,75 @@
+import json
+import os
+import numpy as np
+
+# Checkpoint / resume for long optimizer runs (GWO.py, PSO.py).
+#
+# A checkpoint is one uncompressed .npz file holding every array and score
+# the optimizer lists in CHECKPOINT_STATE, the iteration counter (n_iter) and
+# the bit-generator state of its rng, so a resumed run continues exactly as
+# if it had never stopped. Files are written to a temporary name, fsynced and
+# renamed over the previous checkpoint, so a crash mid-write leaves the last
+# complete checkpoint in place.
+
+
+def save_checkpoint(path, state):
+    # state: name -> array or scalar; dicts (RNG states) are stored as JSON
+    arrays = {name: np.asarray(json.dumps(value) if isinstance(value, dict) else value)
+              for name, value in state.items()}
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        np.savez(f, **arrays)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def load_checkpoint(path):
+    with np.load(path) as data:
+        return {name: data[name] for name in data.files}
+
+
+class Checkpointer:
+    """
+    Saves an optimizer every `every` iterations (and when its run ends) to
+    `path`, and restores it from there when optimize() starts.
+
+    The optimizer must have rng, n_iter and a CHECKPOINT_STATE tuple naming
+    the attributes that make up its state.
+    """
+    def __init__(self, path, every=100):
+        self.path = path
+        self.every = every
+        self.n_saved = 0
+
+    def due(self, n_iter, last=False):
+        return last or n_iter % self.every == 0
+
+    def state(self, optimizer):
+        state = {name: getattr(optimizer, name) for name in optimizer.CHECKPOINT_STATE}
+        state["optimizer"] = type(optimizer).__name__
+        state["n_iter"] = optimizer.n_iter
+        state["rng"] = optimizer.rng.bit_generator.state
+        return state
+
+    def save(self, optimizer):
+        save_checkpoint(self.path, self.state(optimizer))
+        self.n_saved += 1
+
+    def restore(self, optimizer):
+        # Loads the checkpoint into optimizer; False when there is none yet
+        if not os.path.exists(self.path):
+            return False
+        state = load_checkpoint(self.path)
+        if str(state["optimizer"]) != type(optimizer).__name__:
+            raise ValueError(f"{self.path} holds a {state['optimizer']} checkpoint, "
+                             f"not {type(optimizer).__name__}")
+        for name in optimizer.CHECKPOINT_STATE:
+            value = state[name]
+            current = getattr(optimizer, name)
+            if np.ndim(current) and np.shape(current) != value.shape:
+                raise ValueError(f"checkpoint {name} has shape {value.shape}, expected {np.shape(current)}")
+            setattr(optimizer, name, value.copy() if value.ndim else value.item())
+        optimizer.n_iter = int(state["n_iter"])
+        optimizer.rng.bit_generator.state = json.loads(str(state["rng"]))
+        return True
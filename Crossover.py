@@ -1,4 +1,7 @@
-import random
+from operators import (single_point_crossover, two_point_crossover, uniform_crossover,
+                       arithmetic_crossover, half_uniform_crossover)
+
+# Interactive demo of the crossover operators in operators/crossover.py
 
 # Helper function to print crossover results
 def display(p1, p2, c1, c2, title):
@@ -10,58 +13,13 @@ def display(p1, p2, c1, c2, title):
     print(f"Child 2 : {c2}")
     print("-----------------------------\n")
 
-# =============================================================
-# 1. Single Point Crossover
-# =============================================================
-def single_point_crossover(p1, p2):
-    point = random.randint(1, len(p1) - 2)
-    c1 = p1[:point] + p2[point:]
-    c2 = p2[:point] + p1[point:]
-    print(f"Crossover Point: {point}")
-    display(p1, p2, c1, c2, "Single Point Crossover")
-
-# =============================================================
-# 2. Two Point Crossover
-# =============================================================
-def two_point_crossover(p1, p2):
-    point1 = random.randint(1, len(p1) - 3)
-    point2 = random.randint(point1 + 1, len(p1) - 2)
-    c1 = p1[:point1] + p2[point1:point2] + p1[point2:]
-    c2 = p2[:point1] + p1[point1:point2] + p2[point2:]
-    print(f"Crossover Points: {point1}, {point2}")
-    display(p1, p2, c1, c2, "Two Point Crossover")
-
-# =============================================================
-# 3. Uniform Crossover
-# =============================================================
-def uniform_crossover(p1, p2):
-    mask = [random.randint(0, 1) for _ in range(len(p1))]
-    c1, c2 = "", ""
-    for i in range(len(p1)):
-        if mask[i] == 0:
-            c1 += p1[i]
-            c2 += p2[i]
-        else:
-            c1 += p2[i]
-            c2 += p1[i]
-    print("Mask:", mask)
-    display(p1, p2, c1, c2, "Uniform Crossover")
-    
-# ===========================================================
-# 5. Half Uniform Crossover (HUX)
-# =============================================================
-def half_uniform_crossover(p1, p2):
-    diff_positions = [i for i in range(len(p1)) if p1[i] != p2[i]]
-    random.shuffle(diff_positions)
-    half = len(diff_positions) // 2
-    c1, c2 = list(p1), list(p2)
-
-    for i in range(half):
-        pos = diff_positions[i]
-        c1[pos], c2[pos] = c2[pos], c1[pos]
-
-    print("Swapped Positions:", diff_positions[:half])
-    display(p1, p2, "".join(c1), "".join(c2), "Half Uniform Crossover (HUX)")
+OPERATORS = {
+    1: (single_point_crossover, "Single Point Crossover"),
+    2: (two_point_crossover, "Two Point Crossover"),
+    3: (uniform_crossover, "Uniform Crossover"),
+    4: (arithmetic_crossover, "Arithmetic Crossover"),
+    5: (half_uniform_crossover, "Half Uniform Crossover (HUX)"),
+}
 
 # =============================================================
 # Main Program (Menu-Driven)
@@ -85,16 +43,11 @@ def main():
 
         choice = int(input("\nEnter your choice (1-6): "))
 
-        if choice == 1:
-            single_point_crossover(parent1, parent2)
-        elif choice == 2:
-            two_point_crossover(parent1, parent2)
-        elif choice == 3:
-            uniform_crossover(parent1, parent2)
-        # elif choice == 4:
-        #     arithmetic_crossover(parent_num1, parent_num2)
-        elif choice == 5:
-            half_uniform_crossover(parent1, parent2)
+        if choice in OPERATORS:
+            operator, title = OPERATORS[choice]
+            p1, p2 = (parent_num1, parent_num2) if choice == 4 else (parent1, parent2)
+            c1, c2 = operator(p1, p2)
+            display(p1, p2, c1, c2, title)
         elif choice == 6:
             print("Exiting... Thank you!")
             break
@@ -0,0 +1,180 @@
+import os
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+
+# ---- Shared helper ----
+def score_rows(obj_func, rows, batched=False):
+    # batched: obj_func takes the whole matrix and returns one score per row
+    if batched:
+        return np.asarray(obj_func(rows), dtype=float)
+    return np.array([obj_func(row) for row in rows], dtype=float)
+
+
+def _chunks(n, chunk_size):
+    return [(start, min(start + chunk_size, n)) for start in range(0, n, chunk_size)]
+
+
+# =============================================================
+# 1. Serial Evaluator
+# =============================================================
+class SerialEvaluator:
+    """
+    Scores a whole population (one row per individual) in the calling thread.
+    All evaluators are callables: evaluator(positions) -> scores.
+    """
+    def __init__(self, obj_func, batched=False):
+        self.obj_func = obj_func
+        self.batched = batched
+        self.n_evals = 0
+
+    def __call__(self, positions):
+        positions = np.asarray(positions, dtype=float)
+        self.n_evals += len(positions)
+        return self.evaluate(positions)
+
+    def evaluate(self, positions):
+        return score_rows(self.obj_func, positions, self.batched)
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# =============================================================
+# 2. Thread-Pool Evaluator
+# =============================================================
+class ThreadPoolEvaluator(SerialEvaluator):
+    """
+    Splits the population into chunks of `chunk_size` rows and scores them on
+    a thread pool. Useful when obj_func releases the GIL (NumPy, I/O, calls
+    into native simulation code).
+    """
+    def __init__(self, obj_func, n_workers=None, chunk_size=None, batched=False):
+        super().__init__(obj_func, batched)
+        self.n_workers = n_workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self._pool = None
+
+    def _chunk_size(self, n):
+        # Default: about four chunks per worker
+        return self.chunk_size or max(1, -(-n // (4 * self.n_workers)))
+
+    def evaluate(self, positions):
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.n_workers)
+        scores = np.empty(len(positions))
+        jobs = [(start, stop, self._pool.submit(score_rows, self.obj_func, positions[start:stop], self.batched))
+                for start, stop in _chunks(len(positions), self._chunk_size(len(positions)))]
+        for start, stop, job in jobs:
+            scores[start:stop] = job.result()
+        return scores
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+
+# =============================================================
+# 3. Process-Pool Evaluator
+# =============================================================
+# Worker-side state: set once by the pool initializer, so obj_func is pickled
+# once per worker rather than once per task.
+_worker_func = None
+_worker_batched = False
+_worker_blocks = {}
+
+
+def _init_worker(obj_func, batched):
+    global _worker_func, _worker_batched
+    _worker_func = obj_func
+    _worker_batched = batched
+
+
+def _attach(role, name):
+    # Keep one attached block per role; re-attach when the parent reallocates
+    cached = _worker_blocks.get(role)
+    if cached is None or cached.name != name:
+        if cached is not None:
+            cached.close()
+        cached = _worker_blocks[role] = shared_memory.SharedMemory(name=name)
+    return cached
+
+
+def _evaluate_chunk(in_name, out_name, shape, start, stop):
+    positions = np.ndarray(shape, dtype=np.float64, buffer=_attach("in", in_name).buf)
+    scores = np.ndarray((shape[0],), dtype=np.float64, buffer=_attach("out", out_name).buf)
+    scores[start:stop] = score_rows(_worker_func, positions[start:stop], _worker_batched)
+
+
+class ProcessPoolEvaluator(ThreadPoolEvaluator):
+    """
+    Scores chunks of the population in a pool of worker processes.
+
+    Workers stay alive between calls (one pool per evaluator, created on
+    first use). The population and the scores live in shared memory, so each
+    task only sends a row range; obj_func must be picklable (a module-level
+    function). Call close() or use the evaluator as a context manager to
+    stop the workers and free the shared blocks.
+    """
+    def __init__(self, obj_func, n_workers=None, chunk_size=None, batched=False):
+        super().__init__(obj_func, n_workers, chunk_size, batched)
+        self._in = None
+        self._out = None
+
+    def _buffers(self, shape):
+        # Reallocate only when the population outgrows the current blocks
+        n_bytes = int(np.prod(shape)) * 8
+        if self._in is None or self._in.size < n_bytes or self._out.size < shape[0] * 8:
+            self._free()
+            self._in = shared_memory.SharedMemory(create=True, size=max(n_bytes, 8))
+            self._out = shared_memory.SharedMemory(create=True, size=max(shape[0] * 8, 8))
+        positions = np.ndarray(shape, dtype=np.float64, buffer=self._in.buf)
+        scores = np.ndarray((shape[0],), dtype=np.float64, buffer=self._out.buf)
+        return positions, scores
+
+    def evaluate(self, positions):
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.n_workers, initializer=_init_worker,
+                                             initargs=(self.obj_func, self.batched))
+        shared_positions, shared_scores = self._buffers(positions.shape)
+        shared_positions[...] = positions
+        jobs = [self._pool.submit(_evaluate_chunk, self._in.name, self._out.name, positions.shape, start, stop)
+                for start, stop in _chunks(len(positions), self._chunk_size(len(positions)))]
+        for job in jobs:
+            job.result()
+        return shared_scores.copy()
+
+    def _free(self):
+        for block in (self._in, self._out):
+            if block is not None:
+                block.close()
+                block.unlink()
+        self._in = self._out = None
+
+    def close(self):
+        super().close()
+        self._free()
+
+
+# ---- Factory ----
+BACKENDS = {
+    "serial": SerialEvaluator,
+    "thread": ThreadPoolEvaluator,
+    "process": ProcessPoolEvaluator,
+}
+
+
+def make_evaluator(obj_func, backend="serial", n_workers=None, chunk_size=None, batched=False):
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend {backend!r}; choose from {sorted(BACKENDS)}")
+    if backend == "serial":
+        return SerialEvaluator(obj_func, batched)
+    return BACKENDS[backend](obj_func, n_workers=n_workers, chunk_size=chunk_size, batched=batched)
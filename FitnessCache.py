@@ -0,0 +1,138 @@
+import sys
+from collections import OrderedDict
+import numpy as np
+
+# Rough per-entry cost of the OrderedDict slot, key tuple and float score
+_ENTRY_OVERHEAD = 120
+
+
+# ---- Packed, hashable genome keys ----
+def genome_key(genome):
+    """
+    Hashable key for a chromosome:
+    - bit strings ("101101") and bool arrays are packed 8 genes per byte
+    - other NumPy arrays / sequences use their raw bytes, dtype and shape
+    """
+    if isinstance(genome, str):
+        raw = genome.encode()
+        codes = np.frombuffer(raw, dtype=np.uint8)
+        if np.all((codes == 48) | (codes == 49)):          # only '0' / '1'
+            return ("bits", len(raw), np.packbits(codes == 49).tobytes())
+        return ("str", raw)
+    genome = np.asarray(genome)
+    if genome.dtype == bool:
+        return ("bits", genome.shape, np.packbits(genome).tobytes())
+    return (genome.dtype.str, genome.shape, genome.tobytes())
+
+
+# =============================================================
+# LRU Fitness Cache
+# =============================================================
+class FitnessCache:
+    """
+    Wraps a fitness function so repeated chromosomes cost a dict lookup.
+
+    Entries are kept in least-recently-used order and evicted once the
+    estimated footprint exceeds max_bytes (or max_entries, if given).
+    cache(genome) scores one chromosome; cache.evaluate_many(pop) scores a
+    population and, with batched=True, sends only the misses to fitness_func
+    in a single call.
+    """
+    def __init__(self, fitness_func, max_bytes=64 * 2**20, max_entries=None, batched=False):
+        self.fitness_func = fitness_func
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.batched = batched
+        self._entries = OrderedDict()
+        self.n_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _entry_size(self, key):
+        return _ENTRY_OVERHEAD + sys.getsizeof(key[-1])
+
+    def _lookup(self, key):
+        score = self._entries.get(key)
+        if score is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return score
+
+    def _store(self, key, score):
+        self._entries[key] = score
+        self.n_bytes += self._entry_size(key)
+        self.misses += 1
+        while self._entries and (self.n_bytes > self.max_bytes or
+                                 (self.max_entries is not None and len(self._entries) > self.max_entries)):
+            old_key, _ = self._entries.popitem(last=False)
+            self.n_bytes -= self._entry_size(old_key)
+            self.evictions += 1
+
+    def __call__(self, genome):
+        key = genome_key(genome)
+        score = self._lookup(key)
+        if score is None:
+            score = self.fitness_func(genome)
+            self._store(key, score)
+        return score
+
+    def evaluate_many(self, population):
+        keys = [genome_key(genome) for genome in population]
+        scores = np.empty(len(keys))
+        missing = {}     # key -> rows needing that score (duplicates in one batch)
+        for i, key in enumerate(keys):
+            score = self._lookup(key)
+            if score is None:
+                missing.setdefault(key, []).append(i)
+            else:
+                scores[i] = score
+
+        if missing:
+            first_rows = [rows[0] for rows in missing.values()]
+            if self.batched:
+                batch = population[first_rows] if isinstance(population, np.ndarray) else [population[i] for i in first_rows]
+                new_scores = self.fitness_func(batch)
+            else:
+                new_scores = [self.fitness_func(population[i]) for i in first_rows]
+            for (key, rows), score in zip(missing.items(), new_scores):
+                self._store(key, score)
+                scores[rows] = score
+                self.hits += len(rows) - 1
+        return scores
+
+    def clear(self):
+        self._entries.clear()
+        self.n_bytes = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def info(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self.n_bytes,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+# ---- Demo ----
+if __name__ == "__main__":
+    def ones_count(chromosome):
+        return chromosome.count("1")
+
+    cache = FitnessCache(ones_count, max_entries=1000)
+    rng = np.random.default_rng(0)
+    population = ["".join(rng.choice(["0", "1"], 8)) for _ in range(50)]
+    for _ in range(20):
+        scores = cache.evaluate_many(population)
+        # flip one bit in a random individual each round
+        i, j = rng.integers(len(population)), rng.integers(8)
+        bits = list(population[i])
+        bits[j] = "0" if bits[j] == "1" else "1"
+        population[i] = "".join(bits)
+    print("Cache statistics:", cache.info())
@@ -0,0 +1,308 @@
+import inspect
+import time
+import numpy as np
+from operators import (as_generator, tournament_selection, whole_arithmetic_crossover,
+                       blx_alpha_crossover, sbx_crossover, polynomial_mutation, gaussian_mutation)
+from Optimizer import PopulationOptimizer
+
+# Generation-level GA engine for the SIMPLE-GA problem (maximize
+# f(x) = x * sin(10πx) + 1.0 on [0, 1]), with the same operators as
+# "SIMPLE-GA COMPLETE Algorithm.py" applied to the whole population at once:
+#   selection   roulette wheel (cumulative sum + searchsorted) or SUS; the
+#               roulette uniforms are drawn already sorted, so the search
+#               walks the table in order instead of jumping around memory
+#   crossover   with probability CROSS_RATE, child = a * parent + (1 - a) * mate,
+#               mate drawn at random from the selected parents
+#   mutation    with probability MUT_RATE, child += N(0, sigma)
+#   clipping    to X_BOUND
+# Parents and children live in two preallocated buffers that swap roles every
+# generation; every other per-individual array is a preallocated scratch
+# buffer written with out=, so a generation allocates no population-sized
+# arrays apart from the selected indices (np.searchsorted has no out=). The
+# gathers use np.take(mode="clip"): the default mode="raise" fills a hidden
+# temporary before copying into out=, and the indices are in range anyway.
+#
+# RealCodedGA (below) generalises the engine to (pop, dim) matrices with
+# per-dimension bounds, for the same problems as GWO.py and PSO.py.
+
+POP_SIZE = 10
+GENS = 30
+CROSS_RATE = 0.8
+MUT_RATE = 0.1
+X_BOUND = (0.0, 1.0)
+
+
+def fitness_function(x, out=None):
+    # x * sin(10πx) + 1.0 for a whole array, optionally into `out`
+    out = np.multiply(x, 10 * np.pi, out=out)
+    np.sin(out, out=out)
+    out *= x
+    out += 1.0
+    return out
+
+
+class GeneticAlgorithm:
+    """
+    fitness_func: vectorized, f(pop) -> one score per individual (higher is
+                  better, non-negative for the roulette wheel); if it accepts
+                  out=, scores are written into a preallocated array.
+    selection: "roulette" or "sus" (Stochastic Universal Sampling)
+    rng: numpy.random.Generator or seed
+    """
+    def __init__(self, fitness_func=fitness_function, pop_size=POP_SIZE, cross_rate=CROSS_RATE,
+                 mut_rate=MUT_RATE, bounds=X_BOUND, sigma=0.1, selection="roulette", rng=None):
+        if selection not in ("roulette", "sus"):
+            raise ValueError(f"unknown selection {selection!r}; expected 'roulette' or 'sus'")
+        self.fitness_func = fitness_func
+        self._fitness_out = "out" in inspect.signature(fitness_func).parameters
+        self.pop_size = pop_size
+        self.cross_rate = cross_rate
+        self.mut_rate = mut_rate
+        self.bounds = bounds
+        self.sigma = sigma
+        self.selection = selection
+        self.rng = as_generator(rng)
+
+        # Double buffer: _buffers[_current] is the population being evaluated
+        self._buffers = np.empty((2, pop_size))
+        self._current = 0
+        self.rng.random(out=self._buffers[0])
+        self._buffers[0] *= bounds[1] - bounds[0]
+        self._buffers[0] += bounds[0]
+
+        # Scratch buffers, reused every generation
+        self.fitness = np.empty(pop_size)
+        self._cdf = np.empty(pop_size)
+        self._u = np.empty(pop_size)
+        self._idx = np.empty(pop_size, dtype=np.intp)
+        self._mate = np.empty(pop_size)
+        self._mask = np.empty(pop_size, dtype=bool)
+        self._ramp = np.arange(pop_size) / pop_size   # SUS pointer offsets
+        self._spacing = np.empty(pop_size + 1)
+
+        self.generation = 0
+        self.best_x = None
+        self.best_fit = -np.inf
+
+    @property
+    def population(self):
+        return self._buffers[self._current]
+
+    def evaluate(self):
+        # Scores the current population into self.fitness; tracks the best
+        pop = self.population
+        if self._fitness_out:
+            self.fitness_func(pop, out=self.fitness)
+        else:
+            self.fitness[:] = self.fitness_func(pop)
+        best = np.argmax(self.fitness)
+        if self.fitness[best] > self.best_fit:
+            self.best_x, self.best_fit = pop[best], self.fitness[best]
+        return self.fitness
+
+    def _select(self, pop, out):
+        # Fitness-proportional parent indices, gathered into `out`
+        np.cumsum(self.fitness, out=self._cdf)
+        total = self._cdf[-1]
+        if not total > 0:
+            raise ValueError("fitness must have a positive sum for selection")
+        u = self._u
+        if self.selection == "sus":
+            np.add(self._ramp, self.rng.random() / self.pop_size, out=u)
+            u *= total
+        else:
+            # n sorted uniforms (order statistics) from exponential spacings:
+            # the same sample as n independent draws, in ascending order
+            spacing = self._spacing
+            self.rng.standard_exponential(out=spacing)
+            np.cumsum(spacing, out=spacing)
+            np.multiply(spacing[:-1], total / spacing[-1], out=u)
+        idx = np.searchsorted(self._cdf, u, side="right")
+        np.minimum(idx, self.pop_size - 1, out=idx)
+        np.take(pop, idx, out=out, mode="clip")
+
+    def breed(self):
+        # Selection -> crossover -> mutation of the current population into
+        # the other buffer, which then becomes current
+        pop = self.population
+        children = self._buffers[1 - self._current]
+        self._select(pop, children)
+        u, idx, mate, mask = self._u, self._idx, self._mate, self._mask
+
+        # Crossover: mates drawn from the selected parents, applied where mask
+        self.rng.random(out=u)
+        u *= self.pop_size
+        idx[:] = u                                  # floor to a parent index
+        np.take(children, idx, out=mate, mode="clip")
+        self.rng.random(out=u)
+        np.less(u, self.cross_rate, out=mask)
+        self.rng.random(out=u)                      # blend weight a
+        mate -= children                            # child = p + (1 - a) * (mate - p)
+        np.subtract(1.0, u, out=u)
+        mate *= u
+        mate *= mask
+        children += mate
+
+        # Mutation: Gaussian noise where mask
+        self.rng.random(out=u)
+        np.less(u, self.mut_rate, out=mask)
+        self.rng.standard_normal(out=mate)
+        mate *= self.sigma
+        mate *= mask
+        children += mate
+        np.clip(children, self.bounds[0], self.bounds[1], out=children)
+
+        self._current = 1 - self._current
+        self.generation += 1
+
+    def step(self):
+        self.evaluate()
+        self.breed()
+
+    def run(self, n_gens=GENS, telemetry=None, termination=None):
+        """
+        Runs n_gens generations (fewer if `termination` stops it) and scores
+        the final population. Prints one line per generation unless a
+        Telemetry.py recorder is given. Returns (best_x, best_fit).
+        """
+        self.stop_reason = "max_iter"
+        if termination is not None:
+            termination.start(maximize=True)
+        for gen in range(n_gens):
+            t0 = time.perf_counter()
+            fitness = self.evaluate()
+            evaluated = self.population   # left intact by breed() until the next generation
+            t1 = time.perf_counter()
+            if telemetry is None:
+                print(f"Generation {gen+1:02d}: Best X = {self.best_x:.4f}, Fitness = {self.best_fit:.4f}")
+            self.breed()
+            t2 = time.perf_counter()
+            stop = termination is not None and termination.check(self.best_fit, (gen + 1) * self.pop_size,
+                                                                  evaluated) is not None
+            # the last generation is recorded whether or not the pacing wants it
+            if telemetry is not None and (telemetry.wants() or stop or gen == n_gens - 1):
+                telemetry.record(gen + 1, self.best_fit, fitness, evaluated, evaluate=t1 - t0, update=t2 - t1)
+            if stop:
+                self.stop_reason = termination.reason
+                break
+        self.evaluate()
+        if telemetry is not None:
+            telemetry.flush()
+        return self.best_x, self.best_fit
+
+
+# =============================================================
+# Real-coded GA over (pop, dim) matrices
+# =============================================================
+# Both write into the arrays they are given: the crossovers into out = (c1, c2),
+# the mutations into pop itself
+CROSSOVERS = {
+    "arithmetic": lambda ga, p1, p2, out: whole_arithmetic_crossover(p1, p2, ga.bounds, ga.rng, out),
+    "blx": lambda ga, p1, p2, out: blx_alpha_crossover(p1, p2, ga.blx_alpha, ga.bounds, ga.rng, out),
+    "sbx": lambda ga, p1, p2, out: sbx_crossover(p1, p2, ga.eta_c, ga.bounds, ga.rng, out),
+}
+
+MUTATIONS = {
+    "polynomial": lambda ga, pop: polynomial_mutation(pop, ga.bounds, ga.eta_m, ga.mut_rate, ga.rng, pop),
+    "gaussian": lambda ga, pop: gaussian_mutation(pop, ga.sigma, ga.mut_rate, ga.bounds, ga.rng, pop),
+}
+
+
+class RealCodedGA(PopulationOptimizer):
+    """
+    Real-coded GA on a (pop_size, dim) matrix with per-dimension bounds.
+    Minimizes obj_func, and runs on the same loop as GreyWolfOptimizer and
+    ParticleSwarmOptimizer (Optimizer.py), so it takes the same obj_func /
+    dim / bounds / batched / evaluator / telemetry / termination options and
+    supports ask() / tell().
+
+    Each generation: binary tournaments pick 2 * ceil(pop/2) parents, pairs
+    cross over with probability cross_rate ("arithmetic", "blx" or "sbx"),
+    children mutate ("polynomial" or "gaussian", each gene with probability
+    mut_rate, default 1/dim) and the `elitism` best parents are copied over
+    unchanged. Parents and children swap between two preallocated buffers:
+    the selected parents are gathered into a scratch matrix and the kernels
+    write the children straight into the back buffer. What a generation
+    still allocates is the crossover kernels' own scratch (up to two
+    (pop/2, dim) arrays) and arrays the size of the mutated genes.
+    """
+    def __init__(self, obj_func, dim, bounds, pop_size=100, max_iter=100, crossover="sbx", cross_rate=0.9,
+                 mutation="polynomial", mut_rate=None, eta_c=15.0, eta_m=20.0, blx_alpha=0.5, sigma=0.1,
+                 tournament=2, elitism=1, batched=False, evaluator=None, telemetry=None, termination=None,
+                 rng=None):
+        bounds = (np.broadcast_to(np.asarray(bounds[0], dtype=float), (dim,)),
+                  np.broadcast_to(np.asarray(bounds[1], dtype=float), (dim,)))
+        super().__init__(obj_func, dim, bounds, pop_size, max_iter, True, batched, evaluator,
+                         telemetry, termination, rng)
+        self.crossover = CROSSOVERS[crossover]
+        self.mutation = MUTATIONS[mutation]
+        self.cross_rate = cross_rate
+        self.mut_rate = mut_rate
+        self.eta_c = eta_c          # SBX distribution index
+        self.eta_m = eta_m          # polynomial mutation distribution index
+        self.blx_alpha = blx_alpha
+        self.sigma = sigma          # Gaussian mutation step (scalar or per dimension)
+        self.tournament = tournament
+        self.elitism = elitism
+
+        # Double buffer: _buffers[_current] is the population being evaluated.
+        # Rows are rounded up to whole pairs so both children of the last
+        # pair have a row; the spare row (odd pop_size) is never evaluated.
+        low, high = self.bounds
+        n_pairs = (pop_size + 1) // 2
+        self._buffers = np.empty((2, 2 * n_pairs, dim))
+        self._parents = np.empty((2 * n_pairs, dim))
+        self._current = 0
+        self._buffers[0, :pop_size] = low + self.rng.random((pop_size, dim)) * (high - low)
+
+        self.best_position = np.zeros(dim)
+        self.best_score = float("inf")
+
+    @property
+    def positions(self):
+        return self._buffers[self._current, :self.pop_size]
+
+    def result(self):
+        return self.best_position, self.best_score
+
+    def _tell(self, fitness, iteration):
+        # Track the best, then breed into the other buffer
+        pop = self.positions
+        best = np.argmin(fitness)
+        if fitness[best] < self.best_score:
+            self.best_score = fitness[best]
+            self.best_position = pop[best].copy()
+
+        # Parents: tournaments on negated scores (the selectors maximize)
+        n = self.pop_size
+        n_pairs = len(self._parents) // 2
+        selected = tournament_selection(-fitness, self.tournament, 2 * n_pairs, self.rng)
+        parents = np.take(pop, selected, axis=0, out=self._parents, mode="clip")
+        p1, p2 = parents[:n_pairs], parents[n_pairs:]
+        children = self._buffers[1 - self._current]
+        c1, c2 = children[:n_pairs], children[n_pairs:]
+        self.crossover(self, p1, p2, (c1, c2))
+        keep = self.rng.random(n_pairs) >= self.cross_rate
+        c1[keep], c2[keep] = p1[keep], p2[keep]
+
+        children = children[:n]
+        self.mutation(self, children)
+        if self.elitism:
+            elites = np.argpartition(fitness, self.elitism - 1)[:self.elitism]
+            children[:self.elitism] = pop[elites]
+
+        self._current = 1 - self._current
+
+
+# ---- Run Program ----
+if __name__ == "__main__":
+    import sys
+    pop_size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    ga = GeneticAlgorithm(pop_size=pop_size, rng=0)
+    start = time.perf_counter()
+    best_x, best_fit = ga.run(GENS)
+    elapsed = time.perf_counter() - start
+    print("\n==== Final Result ====")
+    print(f"Optimal X = {best_x:.4f}")
+    print(f"Maximum Fitness = {best_fit:.4f}")
+    print(f"{pop_size} individuals x {GENS} generations in {elapsed:.2f} s")
@@ -1,23 +1,35 @@
+import time
 import numpy as np
+from Optimizer import PopulationOptimizer
 
 # Define the objective function (Sphere function)
 def rosenbrock(position):
     a = 1.0
     b = 100.0
-    # Works for n-dimensional input
-    return np.sum((a - position[:-1])**2 + b * (position[1:] - position[:-1]**2)**2)
+    # Works for n-dimensional input, and for a (n_wolves, dim) matrix of
+    # positions at once (one score per row)
+    x, x_next = position[..., :-1], position[..., 1:]
+    return np.sum((a - x)**2 + b * (x_next - x**2)**2, axis=-1)
 
 # Grey Wolf Optimizer
-class GreyWolfOptimizer:
-    def __init__(self, obj_func, dim, bounds, n_wolves=20, max_iter=100):
-        self.obj_func = obj_func
-        self.dim = dim
-        self.bounds = bounds
+class GreyWolfOptimizer(PopulationOptimizer):
+    # Attributes saved by a Checkpoint.py Checkpointer (with rng and n_iter)
+    CHECKPOINT_STATE = ("positions", "fitness", "alpha_pos", "beta_pos", "delta_pos",
+                        "alpha_score", "beta_score", "delta_score")
+    
+    def __init__(self, obj_func, dim, bounds, n_wolves=20, max_iter=100,
+                 vectorized=False, batched=False, evaluator=None, telemetry=None,
+                 termination=None, rng=None, checkpoint=None):
+        # Run options (vectorized, batched, evaluator, telemetry, termination,
+        # rng, checkpoint) are described in Optimizer.py. One block of random
+        # numbers is drawn per iteration, laid out the same for both engines
+        # so they give identical results for the same seed.
+        super().__init__(obj_func, dim, bounds, n_wolves, max_iter, vectorized, batched, evaluator,
+                         telemetry, termination, rng, checkpoint)
         self.n_wolves = n_wolves
-        self.max_iter = max_iter
         
         # Initialize wolves randomly within bounds
-        self.positions = np.random.uniform(bounds[0], bounds[1], (n_wolves, dim))
+        self.positions = self.rng.uniform(bounds[0], bounds[1], (n_wolves, dim))
         
         # Initialize alpha, beta, delta wolves
         self.alpha_pos = np.zeros(dim)
@@ -28,67 +40,110 @@ class GreyWolfOptimizer:
         self.beta_score = float("inf")
         self.delta_score = float("inf")
 
-    def optimize(self):
-        for iteration in range(self.max_iter):
-            for i in range(self.n_wolves):
-                # Ensure wolves stay within bounds
-                self.positions[i] = np.clip(self.positions[i], self.bounds[0], self.bounds[1])
-                
-                # Evaluate fitness
-                fitness = self.obj_func(self.positions[i])
-                
-                # Update alpha, beta, delta wolves
-                if fitness < self.alpha_score:
-                    self.delta_score = self.beta_score
-                    self.delta_pos = self.beta_pos.copy()
-                    
-                    self.beta_score = self.alpha_score
-                    self.beta_pos = self.alpha_pos.copy()
-                    
-                    self.alpha_score = fitness
-                    self.alpha_pos = self.positions[i].copy()
+    @property
+    def best_score(self):
+        return self.alpha_score
+
+    def result(self):
+        return self.alpha_pos, self.alpha_score ,self.beta_score ,self.delta_score
+
+    def _loop_step(self, iteration):
+        t0 = time.perf_counter()
+        for i in range(self.n_wolves):
+            # Ensure wolves stay within bounds
+            self.positions[i] = np.clip(self.positions[i], self.bounds[0], self.bounds[1])
+            
+            # Evaluate fitness
+            fitness = self.fitness[i] = self.obj_func(self.positions[i])
+            
+            # Update alpha, beta, delta wolves
+            if fitness < self.alpha_score:
+                self.delta_score = self.beta_score
+                self.delta_pos = self.beta_pos.copy()
                 
-                elif fitness < self.beta_score:
-                    self.delta_score = self.beta_score
-                    self.delta_pos = self.beta_pos.copy()
-                    
-                    self.beta_score = fitness
-                    self.beta_pos = self.positions[i].copy()
+                self.beta_score = self.alpha_score
+                self.beta_pos = self.alpha_pos.copy()
                 
-                elif fitness < self.delta_score:
-                    self.delta_score = fitness
-                    self.delta_pos = self.positions[i].copy()
-            
-            # Parameter 'a' decreases linearly from 2 to 0
-            a = 2 - iteration * (2 / self.max_iter)
+                self.alpha_score = fitness
+                self.alpha_pos = self.positions[i].copy()
             
-            # Update positions of wolves
-            for i in range(self.n_wolves):
-                for d in range(self.dim):
-                    r1, r2 = np.random.rand(), np.random.rand()
-                    A1 = 2 * a * r1 - a
-                    C1 = 2 * r2
-                    D_alpha = abs(C1 * self.alpha_pos[d] - self.positions[i][d])
-                    X1 = self.alpha_pos[d] - A1 * D_alpha
-                    
-                    r1, r2 = np.random.rand(), np.random.rand()
-                    A2 = 2 * a * r1 - a
-                    C2 = 2 * r2
-                    D_beta = abs(C2 * self.beta_pos[d] - self.positions[i][d])
-                    X2 = self.beta_pos[d] - A2 * D_beta
-                    
-                    r1, r2 = np.random.rand(), np.random.rand()
-                    A3 = 2 * a * r1 - a
-                    C3 = 2 * r2
-                    D_delta = abs(C3 * self.delta_pos[d] - self.positions[i][d])
-                    X3 = self.delta_pos[d] - A3 * D_delta
-                    
-                    # Final update
-                    self.positions[i][d] = (X1 + X2 + X3) / 3.0
+            elif fitness < self.beta_score:
+                self.delta_score = self.beta_score
+                self.delta_pos = self.beta_pos.copy()
+                
+                self.beta_score = fitness
+                self.beta_pos = self.positions[i].copy()
             
-            print(f"Iteration {iteration+1}/{self.max_iter}, Best Fitness: {self.alpha_score:.6f}")
+            elif fitness < self.delta_score:
+                self.delta_score = fitness
+                self.delta_pos = self.positions[i].copy()
         
-        return self.alpha_pos, self.alpha_score ,self.beta_score ,self.delta_score
+        self.scored_positions = self.positions.copy()
+        t1 = time.perf_counter()
+        
+        # Parameter 'a' decreases linearly from 2 to 0
+        a = 2 - iteration * (2 / self.max_iter)
+        
+        # Update positions of wolves; r[i, d, k] = (r1, r2) for leader k
+        r = self._draw()
+        for i in range(self.n_wolves):
+            for d in range(self.dim):
+                r1, r2 = r[i, d, 0]
+                A1 = 2 * a * r1 - a
+                C1 = 2 * r2
+                D_alpha = abs(C1 * self.alpha_pos[d] - self.positions[i][d])
+                X1 = self.alpha_pos[d] - A1 * D_alpha
+                
+                r1, r2 = r[i, d, 1]
+                A2 = 2 * a * r1 - a
+                C2 = 2 * r2
+                D_beta = abs(C2 * self.beta_pos[d] - self.positions[i][d])
+                X2 = self.beta_pos[d] - A2 * D_beta
+                
+                r1, r2 = r[i, d, 2]
+                A3 = 2 * a * r1 - a
+                C3 = 2 * r2
+                D_delta = abs(C3 * self.delta_pos[d] - self.positions[i][d])
+                X3 = self.delta_pos[d] - A3 * D_delta
+                
+                # Final update
+                self.positions[i][d] = (X1 + X2 + X3) / 3.0
+        
+        self.phase_times = (t1 - t0, time.perf_counter() - t1)
+
+    def _draw(self):
+        # All of an iteration's random numbers in one call
+        return self.rng.random((self.n_wolves, self.dim, 3, 2))
+
+    # ---- Vectorized engine ----
+    def _update_leaders(self, positions, fitness):
+        # Same result as the sequential alpha/beta/delta cascade: the three
+        # best of (current leaders + candidates), ties going to the incumbents
+        top = np.argsort(fitness, kind="stable")[:3]
+        scores = np.concatenate(([self.alpha_score, self.beta_score, self.delta_score], fitness[top]))
+        candidates = np.vstack((self.alpha_pos, self.beta_pos, self.delta_pos, positions[top]))
+        order = np.argsort(scores, kind="stable")[:3]
+        
+        self.alpha_score, self.beta_score, self.delta_score = (scores[k] for k in order)
+        self.alpha_pos, self.beta_pos, self.delta_pos = (candidates[k].copy() for k in order)
+
+    def _tell(self, fitness, iteration):
+        self._update_leaders(self.positions, fitness)
+        
+        # Parameter 'a' decreases linearly from 2 to 0
+        a = 2 - iteration * (2 / self.max_iter)
+        
+        # One draw for all wolves x (alpha, beta, delta) x dimensions
+        r1, r2 = self._draw().transpose(3, 0, 2, 1)
+        A = 2 * a * r1 - a
+        C = 2 * r2
+        
+        leaders = np.stack((self.alpha_pos, self.beta_pos, self.delta_pos))   # (3, dim)
+        D = np.abs(C * leaders - self.positions[:, None, :])
+        X = leaders - A * D
+        
+        # Final update
+        self.positions = X.sum(axis=1) / 3.0
 
 
 # Main function
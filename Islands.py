@@ -0,0 +1,276 @@
+import os
+import importlib.util
+import multiprocessing as mp
+import numpy as np
+
+
+# =============================================================
+# Island adapters
+# =============================================================
+# Each adapter wraps one population and exposes the same small interface:
+#   run(n_iter)                  advance the population n_iter iterations
+#   emigrants(n)                 (positions, scores) of its n best individuals
+#   immigrate(pos, scores, n)    replace its n worst with the n best incoming
+#   best()                       (position, score) of the best seen so far
+# `maximize` tells the runner which direction is better for the scores.
+
+class _Island:
+    maximize = False
+
+    def _best_first(self, scores):
+        return np.argsort(-scores if self.maximize else scores, kind="stable")
+
+
+class GWOIsland(_Island):
+    """Grey Wolf pack; emigrants are its alpha/beta/delta wolves (at most 3)."""
+    def __init__(self, optimizer):
+        self.opt = optimizer
+        self.iteration = 0
+
+    def run(self, n_iter):
+        stop = min(self.iteration + n_iter, self.opt.max_iter)
+        for iteration in range(self.iteration, stop):
+            self.opt.step(iteration)
+        self.iteration = stop
+
+    def emigrants(self, n):
+        positions = np.stack((self.opt.alpha_pos, self.opt.beta_pos, self.opt.delta_pos))[:n]
+        scores = np.array([self.opt.alpha_score, self.opt.beta_score, self.opt.delta_score])[:n]
+        return positions, scores
+
+    def immigrate(self, positions, scores, n):
+        incoming = self._best_first(scores)[:n]
+        worst = self._best_first(self.opt.fitness)[::-1][:len(incoming)]
+        self.opt.positions[worst] = positions[incoming]
+        self.opt._update_leaders(positions[incoming], scores[incoming])
+
+    def best(self):
+        return self.opt.alpha_pos, self.opt.alpha_score
+
+
+class PSOIsland(_Island):
+    """Particle swarm; emigrants are the best personal-best positions."""
+    def __init__(self, optimizer):
+        self.opt = optimizer
+        self.iteration = 0
+
+    def run(self, n_iter):
+        stop = min(self.iteration + n_iter, self.opt.max_iter)
+        for iteration in range(self.iteration, stop):
+            self.opt.step(iteration)
+        self.iteration = stop
+
+    def emigrants(self, n):
+        top = self._best_first(self.opt.pbest_scores)[:n]
+        return self.opt.pbest_positions[top], self.opt.pbest_scores[top]
+
+    def immigrate(self, positions, scores, n):
+        incoming = self._best_first(scores)[:n]
+        worst = self._best_first(self.opt.pbest_scores)[::-1][:len(incoming)]
+        self.opt.positions[worst] = positions[incoming]
+        self.opt.pbest_positions[worst] = positions[incoming]
+        self.opt.pbest_scores[worst] = scores[incoming]
+        self.opt.velocities[worst] = 0.0
+        best = incoming[0]
+        if scores[best] < self.opt.gbest_score:
+            self.opt.gbest_score = scores[best]
+            self.opt.gbest_position = positions[best].copy()
+
+    def best(self):
+        return self.opt.gbest_position, self.opt.gbest_score
+
+
+def load_simple_ga():
+    # The SIMPLE-GA script has spaces in its file name, so load it by path
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "SIMPLE-GA COMPLETE Algorithm.py")
+    spec = importlib.util.spec_from_file_location("simple_ga", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class GAIsland(_Island):
+    """One population of the SIMPLE-GA loop (maximizes fitness)."""
+    maximize = True
+
+    def __init__(self, pop_size=None, evaluator=None, rng=None):
+        self.ga = load_simple_ga()
+        self.evaluator = evaluator
+        self.rng = np.random.default_rng(rng)
+        self.pop = self.ga.init_population(pop_size or self.ga.POP_SIZE, self.rng)
+        self.fitness = self.ga.get_fitness(self.pop, evaluator)
+        self._track_best()
+
+    def _track_best(self):
+        i = np.argmax(self.fitness)
+        if not hasattr(self, "best_fit") or self.fitness[i] > self.best_fit:
+            self.best_x, self.best_fit = self.pop[i], self.fitness[i]
+
+    def run(self, n_iter):
+        for _ in range(n_iter):
+            self.pop = self.ga.next_generation(self.pop, self.fitness, self.rng)
+            self.fitness = self.ga.get_fitness(self.pop, self.evaluator)
+            self._track_best()
+
+    def emigrants(self, n):
+        top = self._best_first(self.fitness)[:n]
+        return self.pop[top], self.fitness[top]
+
+    def immigrate(self, positions, scores, n):
+        incoming = self._best_first(scores)[:n]
+        worst = self._best_first(self.fitness)[::-1][:len(incoming)]
+        self.pop[worst] = positions[incoming]
+        self.fitness[worst] = scores[incoming]
+
+    def best(self):
+        return self.best_x, self.best_fit
+
+
+# =============================================================
+# Migration topologies
+# =============================================================
+def migration_sources(topology, n_islands):
+    # sources[i] lists the islands that send migrants to island i
+    islands = range(n_islands)
+    if topology == "ring":
+        return [[(i - 1) % n_islands] for i in islands]
+    if topology == "star":
+        # Island 0 is the hub: it collects from all and broadcasts to all
+        return [[j for j in islands if j != 0] if i == 0 else [0] for i in islands]
+    if topology == "full":
+        return [[j for j in islands if j != i] for i in islands]
+    raise ValueError(f"Unknown topology {topology!r}; choose from 'ring', 'star', 'full'")
+
+
+# =============================================================
+# Island handles: in-process or one worker process per island
+# =============================================================
+def _build_island(make_island, index, seed):
+    # Independent random stream per island: seed is the island's child of
+    # the runner's SeedSequence
+    return make_island(index, np.random.default_rng(seed))
+
+
+def _island_worker(conn, make_island, index, seed):
+    island = _build_island(make_island, index, seed)
+    conn.send(island.maximize)
+    while True:
+        method, args = conn.recv()
+        if method == "close":
+            break
+        conn.send(getattr(island, method)(*args))
+    conn.close()
+
+
+class _LocalHandle:
+    def __init__(self, make_island, index, seed):
+        self.island = _build_island(make_island, index, seed)
+        self.maximize = self.island.maximize
+        self._result = None
+
+    def send(self, method, *args):
+        self._result = getattr(self.island, method)(*args)
+
+    def recv(self):
+        return self._result
+
+    def close(self):
+        pass
+
+
+class _ProcessHandle:
+    def __init__(self, make_island, index, seed):
+        self.conn, child = mp.Pipe()
+        self.process = mp.Process(target=_island_worker, args=(child, make_island, index, seed), daemon=True)
+        self.process.start()
+        child.close()
+        self.maximize = self.conn.recv()
+
+    def send(self, method, *args):
+        self.conn.send((method, args))
+
+    def recv(self):
+        return self.conn.recv()
+
+    def close(self):
+        self.conn.send(("close", ()))
+        self.process.join()
+
+
+# =============================================================
+# Island Runner
+# =============================================================
+class IslandRunner:
+    """
+    Runs n_islands independent populations and migrates the best individuals
+    between them every `migration_interval` iterations.
+
+    make_island(index, rng) must return an island adapter (GWOIsland,
+    PSOIsland, GAIsland, ...) whose optimizer draws from rng, a Generator on
+    the island's own stream spawned from `seed`; runs with the same seed are
+    reproducible, in-process or not. With processes=True each island lives in its own worker
+    process for the whole run, so make_island has to be picklable when the
+    start method is not 'fork'.
+    """
+    def __init__(self, make_island, n_islands=4, n_iter=100, migration_interval=10,
+                 n_migrants=2, topology="ring", seed=None, processes=True):
+        self.make_island = make_island
+        self.n_islands = n_islands
+        self.n_iter = n_iter
+        self.migration_interval = migration_interval
+        self.n_migrants = n_migrants
+        self.sources = migration_sources(topology, n_islands)
+        self.seeds = np.random.SeedSequence(seed).spawn(n_islands)
+        self.processes = processes
+        self.history = []   # best score after each epoch
+
+    def _broadcast(self, handles, method, *args):
+        for handle in handles:
+            handle.send(method, *args)
+        return [handle.recv() for handle in handles]
+
+    def _best(self, handles):
+        results = self._broadcast(handles, "best")
+        scores = np.array([score for _, score in results])
+        i = np.argmax(scores) if handles[0].maximize else np.argmin(scores)
+        return results[i]
+
+    def run(self):
+        Handle = _ProcessHandle if self.processes else _LocalHandle
+        handles = [Handle(self.make_island, i, seed) for i, seed in enumerate(self.seeds)]
+        try:
+            done = 0
+            while done < self.n_iter:
+                epoch = min(self.migration_interval, self.n_iter - done)
+                self._broadcast(handles, "run", epoch)
+                done += epoch
+
+                if done < self.n_iter:
+                    emigrants = self._broadcast(handles, "emigrants", self.n_migrants)
+                    for handle, sources in zip(handles, self.sources):
+                        positions = np.concatenate([emigrants[j][0] for j in sources])
+                        scores = np.concatenate([emigrants[j][1] for j in sources])
+                        handle.send("immigrate", positions, scores, self.n_migrants)
+                    for handle in handles:
+                        handle.recv()
+
+                self.history.append(self._best(handles)[1])
+            return self._best(handles)
+        finally:
+            for handle in handles:
+                handle.close()
+
+
+# ---- Example ----
+def _make_pso_island(index, rng):
+    from PSO import ParticleSwarmOptimizer, rosenbrock
+    return PSOIsland(ParticleSwarmOptimizer(rosenbrock, 5, (-10, 10), n_particles=100, max_iter=500, batched=True,
+                                            rng=rng))
+
+
+if __name__ == "__main__":
+    runner = IslandRunner(_make_pso_island, n_islands=4, n_iter=500, migration_interval=25,
+                          n_migrants=2, topology="ring", seed=42)
+    best_position, best_score = runner.run()
+    print("Best Position:", best_position)
+    print("Best (Global) Fitness:", best_score)
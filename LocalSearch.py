@@ -0,0 +1,159 @@
+import numpy as np
+
+# Local search for symmetric TSP tours: 2-opt and Or-opt restricted to
+# neighbour lists, driven by don't-look bits. Only nodes next to a recent
+# change are re-examined, so a pass costs roughly O(n * k) rather than
+# O(n^2). neighbours[a] lists a's nearest nodes, nearest first (for example
+# AntColonyOptimizer.candidates or ACO.nearest_neighbours).
+
+
+def _reverse(tour, pos, i, j):
+    # 2-opt move: reverse the cyclic segment tour[i+1 .. j], or its
+    # complement tour[j+1 .. i] if that is shorter (same tour, other way round)
+    n = len(tour)
+    length = (j - i) % n
+    start = i + 1
+    if length > n - length:
+        start, length = j + 1, n - length
+    idx = (start + np.arange(length)) % n
+    tour[idx] = tour[idx[::-1]]
+    pos[tour[idx]] = idx
+
+
+def two_opt(tour, distances, neighbours, active=None):
+    """
+    First-improvement 2-opt on `tour` (modified in place). Returns the set of
+    nodes touched by improving moves. active: nodes to start from
+    (don't-look bits off); all nodes by default.
+    """
+    n = len(tour)
+    D = distances
+    pos = np.empty(n, dtype=np.intp)
+    pos[tour] = np.arange(n)
+    queue = list(range(n)) if active is None else list(active)
+    queued = np.zeros(n, dtype=bool)
+    queued[queue] = True
+    touched = set()
+
+    while queue:
+        a = queue.pop()
+        queued[a] = False
+        for forward in (True, False):
+            i = pos[a]
+            a_next = tour[(i + 1) % n] if forward else tour[i - 1]
+            d_a = D[a, a_next]
+            improved = False
+            for c in neighbours[a]:
+                d_ac = D[a, c]
+                if d_ac >= d_a:
+                    break                  # neighbours are sorted: no gain left
+                j = pos[c]
+                c_next = tour[(j + 1) % n] if forward else tour[j - 1]
+                if c_next == a:
+                    continue
+                delta = d_ac + D[a_next, c_next] - d_a - D[c, c_next]
+                if delta < -1e-12:
+                    if forward:
+                        _reverse(tour, pos, i, j)
+                    else:
+                        # same move expressed on the predecessors
+                        _reverse(tour, pos, pos[c_next], pos[a_next])
+                    for node in (a, a_next, c, c_next):
+                        touched.add(node)
+                        if not queued[node]:
+                            queued[node] = True
+                            queue.append(node)
+                    improved = True
+                    break
+            if improved:
+                break
+    return touched
+
+
+def or_opt(tour, distances, neighbours, segment_lengths=(1, 2, 3), active=None):
+    """
+    Or-opt on `tour` (modified in place): move a segment of 1-3 nodes,
+    possibly reversed, next to one of its endpoints' neighbours. Returns the
+    set of nodes touched by improving moves.
+    """
+    n = len(tour)
+    D = distances
+    pos = np.empty(n, dtype=np.intp)
+    pos[tour] = np.arange(n)
+    queue = list(range(n)) if active is None else list(active)
+    queued = np.zeros(n, dtype=bool)
+    queued[queue] = True
+    in_seg = np.zeros(n, dtype=bool)
+    touched = set()
+
+    while queue:
+        first = queue.pop()
+        queued[first] = False
+        for seg_len in segment_lengths:
+            if seg_len > n - 3:
+                break
+            i = pos[first]
+            seg = tour[(i + np.arange(seg_len)) % n]
+            last = seg[-1]
+            prev, nxt = tour[i - 1], tour[(i + seg_len) % n]
+            remove_gain = D[prev, first] + D[last, nxt] - D[prev, nxt]
+            if remove_gain <= 1e-12:
+                continue
+            in_seg[seg] = True
+
+            # Insert between c and its successor or predecessor c_other, with
+            # `end` next to c. As in 2-opt, only neighbours closer than the
+            # removal gain are tried; all of them at once.
+            best = (-1e-12, None)
+            for end, other in ((first, last), (last, first)):
+                c = neighbours[end]
+                c = c[:np.searchsorted(D[end, c], remove_gain)]
+                if not len(c):
+                    continue
+                for c_other in (tour[(pos[c] + 1) % n], tour[pos[c] - 1]):
+                    delta = D[c, end] + D[other, c_other] - D[c, c_other] - remove_gain
+                    delta[in_seg[c] | in_seg[c_other]] = np.inf
+                    k = np.argmin(delta)
+                    if delta[k] < best[0]:
+                        best = (delta[k], (c[k], c_other[k], end))
+            in_seg[seg] = False
+            if best[1] is None:
+                continue
+
+            c, c_other, end = best[1]
+            rest = np.delete(tour, (i + np.arange(seg_len)) % n)
+            k = int(np.flatnonzero(rest == c)[0])
+            # orient the segment so `end` touches c
+            after = rest[(k + 1) % len(rest)] == c_other
+            piece = seg if (end == first) == after else seg[::-1]
+            new = np.concatenate((rest[:k + 1], piece, rest[k + 1:])) if after else \
+                np.concatenate((rest[:k], piece, rest[k:]))
+            tour[:] = new
+            pos[tour] = np.arange(n)
+            for node in (prev, nxt, c, c_other, first, last):
+                touched.add(node)
+                if not queued[node]:
+                    queued[node] = True
+                    queue.append(node)
+            break
+    return touched
+
+
+def improve_tour(tour, distances, neighbours, moves=("2opt", "oropt")):
+    """
+    Alternates 2-opt and Or-opt until neither improves; after the first
+    round only nodes touched by the previous round are re-examined.
+    Returns (improved_tour, length).
+    """
+    tour = np.array(tour, dtype=np.intp)
+    active = None
+    while True:
+        touched = set()
+        if "2opt" in moves:
+            touched |= two_opt(tour, distances, neighbours, active)
+        if "oropt" in moves:
+            touched |= or_opt(tour, distances, neighbours, active=active)
+        if not touched:
+            break
+        active = touched
+    return tour, distances[tour, np.roll(tour, -1)].sum()
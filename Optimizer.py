@@ -0,0 +1,161 @@
+import time
+import numpy as np
+
+from Evaluation import score_rows
+from operators import as_generator
+
+# Run loop shared by GreyWolfOptimizer (GWO.py), ParticleSwarmOptimizer
+# (PSO.py) and RealCodedGA (GA.py). Every iteration scores the population
+# matrix and then advances it:
+#   ask()           the (pop_size, dim) positions to score
+#   tell(scores)    update the bests and move the population
+# step() is ask -> evaluate -> tell; optimize() runs steps until max_iter or
+# the termination criteria, with printing / telemetry and checkpointing.
+# A driver that evaluates elsewhere (AsyncDriver.py) runs the same loop with
+# begin_run(), ask() / tell() and end_iteration().
+
+
+class PopulationOptimizer:
+    """
+    Base class for population-based minimizers over a positions matrix.
+
+    A subclass sets self.positions, provides best_score (the best score so
+    far), result() (what optimize() returns) and _tell(fitness, iteration)
+    (update bests and move), and lists the attributes a Checkpoint.py
+    Checkpointer should save in CHECKPOINT_STATE. _tell must rebind
+    self.positions rather than move it in place, so the scored matrix stays
+    available as scored_positions. It may also provide _loop_step(iteration),
+    its original per-individual iteration, used when vectorized is False; that
+    sets scored_positions itself.
+    """
+    CHECKPOINT_STATE = ()
+
+    def __init__(self, obj_func, dim, bounds, pop_size, max_iter, vectorized=False, batched=False,
+                 evaluator=None, telemetry=None, termination=None, rng=None, checkpoint=None):
+        self.obj_func = obj_func
+        self.dim = dim
+        self.bounds = bounds
+        self.pop_size = pop_size
+        self.max_iter = max_iter
+
+        # vectorized: update the whole population as arrays instead of per individual
+        # batched: obj_func(positions) takes the (pop_size, dim) matrix and
+        #          returns one score per row (implies vectorized)
+        # evaluator: an Evaluation.py evaluator (serial/thread/process) that
+        #            scores the whole matrix (implies vectorized)
+        self.batched = batched
+        self.evaluator = evaluator
+        self.vectorized = vectorized or batched or evaluator is not None
+
+        # telemetry: a Telemetry.py recorder; iterations are recorded there
+        #            instead of printed
+        self.telemetry = telemetry
+        self.fitness = np.full(pop_size, np.inf)
+        self.scored_positions = None    # the positions `fitness` was computed for
+        self.phase_times = (0.0, 0.0)   # (evaluate, update) seconds, last iteration
+
+        # termination: a Termination.py object checked after every iteration;
+        #              stop_reason says why the last run ended
+        self.termination = termination
+        self.n_iter = 0
+        self.stop_reason = None
+        self._asked = None    # time of the ask() waiting for its tell()
+
+        # checkpoint: a Checkpoint.py Checkpointer; optimize() resumes from
+        #             its file when there is one and saves periodically
+        self.checkpoint = checkpoint
+
+        # rng: numpy.random.Generator (or seed) all random numbers come from
+        self.rng = as_generator(rng)
+
+    def optimize(self):
+        self.begin_run()
+        for iteration in range(self.n_iter, self.max_iter):
+            if self.vectorized:
+                self.step(iteration)
+            else:
+                self._loop_step(iteration)
+            if self.end_iteration(iteration):
+                break
+
+        return self.result()
+
+    def begin_run(self):
+        # Resets the run state, resumes from the checkpoint when there is one
+        # and starts the termination clock; iterate from n_iter afterwards
+        self.n_iter = 0
+        self.stop_reason = "max_iter"
+        if self.checkpoint is not None:
+            self.checkpoint.restore(self)
+        if self.termination is not None:
+            self.termination.start()
+
+    def end_iteration(self, iteration):
+        # Reports the iteration and returns True when the run should stop
+        stop = self._should_stop(iteration)
+        self._report(iteration, stop)
+        return stop
+
+    def _should_stop(self, iteration):
+        # Checked after every iteration; True ends the run early. Saves a
+        # checkpoint when one is due and when the run ends.
+        self.n_iter = iteration + 1
+        stop = (self.termination is not None and
+                self.termination.check(self.best_score, self.n_iter * self.pop_size,
+                                       self.scored_positions) is not None)
+        if self.checkpoint is not None and self.checkpoint.due(self.n_iter, stop or self.n_iter == self.max_iter):
+            self.checkpoint.save(self)
+        if stop:
+            self.stop_reason = self.termination.reason
+        return stop
+
+    def _report(self, iteration, stop):
+        # Prints the iteration, or hands it to the telemetry; the last
+        # iteration of a run (max_iter or stopped) is always recorded
+        if self.telemetry is None:
+            print(f"Iteration {iteration+1}/{self.max_iter}, Best Fitness: {self.best_score:.6f}")
+            if stop:
+                print(f"Stopped after {self.n_iter} iterations: {self.termination.message}")
+            return
+        last = stop or iteration == self.max_iter - 1
+        if self.telemetry.wants() or last:
+            self.telemetry.record(iteration + 1, self.best_score, self.fitness, self.scored_positions,
+                                  evaluate=self.phase_times[0], update=self.phase_times[1])
+        if last:
+            self.telemetry.flush()
+
+    def _evaluate(self, positions):
+        if self.evaluator is not None:
+            return self.evaluator(positions)
+        return score_rows(self.obj_func, positions, self.batched)
+
+    # ---- Ask / tell ----
+    # ask() hands out the population to score; tell(scores) takes the scores
+    # in the same row order and advances the population one iteration
+    # (vectorized update). The caller does the evaluation, e.g. AsyncDriver.py
+    # or an external queue. The time between the two is the iteration's
+    # evaluate phase, the time spent in tell() its update phase.
+    def ask(self):
+        # Keep the population within bounds
+        np.clip(self.positions, self.bounds[0], self.bounds[1], out=self.positions)
+        self._asked = time.perf_counter()
+        return self.positions.copy()
+
+    def tell(self, scores, iteration=None):
+        t1 = time.perf_counter()
+        if self._asked is None:
+            raise RuntimeError("tell() called without a pending ask()")
+        fitness = np.asarray(scores, dtype=float)
+        if fitness.shape != (self.pop_size,):
+            raise ValueError(f"expected {self.pop_size} scores, got shape {fitness.shape}")
+        t0, self._asked = self._asked, None
+        iteration = self.n_iter if iteration is None else iteration
+        self.fitness = fitness
+        self.scored_positions = self.positions
+        self._tell(fitness, iteration)
+        self.n_iter = iteration + 1
+        self.phase_times = (t1 - t0, time.perf_counter() - t1)
+
+    def step(self, iteration):
+        # One vectorized iteration: evaluate the population, update, move
+        self.tell(self._evaluate(self.ask()), iteration)
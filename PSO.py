@@ -1,18 +1,28 @@
+import time
 import numpy as np
+from Optimizer import PopulationOptimizer
 
 # Objective Function: Rosenbrock Function
 def rosenbrock(position):
-    return np.sum(position**2)
+    # Works for a single position or a (n_particles, dim) matrix of positions
+    return np.sum(position**2, axis=-1)
 
 
 # Particle Swarm Optimizer (PSO)
-class ParticleSwarmOptimizer:
-    def __init__(self, obj_func, dim, bounds, n_particles=30, max_iter=100, w=0.7, c1=1.5, c2=1.5):
-        self.obj_func = obj_func
-        self.dim = dim
-        self.bounds = bounds
+class ParticleSwarmOptimizer(PopulationOptimizer):
+    # Attributes saved by a Checkpoint.py Checkpointer (with rng and n_iter)
+    CHECKPOINT_STATE = ("positions", "velocities", "fitness", "pbest_positions", "pbest_scores",
+                        "gbest_position", "gbest_score")
+    
+    def __init__(self, obj_func, dim, bounds, n_particles=30, max_iter=100, w=0.7, c1=1.5, c2=1.5,
+                 vectorized=False, batched=False, evaluator=None, telemetry=None,
+                 termination=None, rng=None, checkpoint=None):
+        # Run options (vectorized, batched, evaluator, telemetry, termination,
+        # rng, checkpoint) are described in Optimizer.py. One block of random
+        # numbers is drawn per iteration.
+        super().__init__(obj_func, dim, bounds, n_particles, max_iter, vectorized, batched, evaluator,
+                         telemetry, termination, rng, checkpoint)
         self.n_particles = n_particles
-        self.max_iter = max_iter
         
         # Parameters
         self.w = w        # inertia weight
@@ -20,8 +30,8 @@ class ParticleSwarmOptimizer:
         self.c2 = c2      # social coefficient
         
         # Initialize particles
-        self.positions = np.random.uniform(bounds[0], bounds[1], (n_particles, dim))
-        self.velocities = np.random.uniform(-1, 1, (n_particles, dim))
+        self.positions = self.rng.uniform(bounds[0], bounds[1], (n_particles, dim))
+        self.velocities = self.rng.uniform(-1, 1, (n_particles, dim))
         
         # Initialize personal and global bests
         self.pbest_positions = self.positions.copy()
@@ -29,41 +39,74 @@ class ParticleSwarmOptimizer:
         self.gbest_position = np.zeros(dim)
         self.gbest_score = float('inf')
 
-    def optimize(self):
-        for iteration in range(self.max_iter):
-            for i in range(self.n_particles):
-                # Keep particle within bounds
-                self.positions[i] = np.clip(self.positions[i], self.bounds[0], self.bounds[1])
-                
-                # Evaluate fitness
-                fitness = self.obj_func(self.positions[i])
-                
-                # Update personal best
-                if fitness < self.pbest_scores[i]:
-                    self.pbest_scores[i] = fitness
-                    self.pbest_positions[i] = self.positions[i].copy()
-                    
-                # Update global best
-                if fitness < self.gbest_score:
-                    self.gbest_score = fitness
-                    self.gbest_position = self.positions[i].copy()
+    @property
+    def best_score(self):
+        return self.gbest_score
+
+    def result(self):
+        return self.gbest_position, self.gbest_score
+
+    def _loop_step(self, iteration):
+        t0 = time.perf_counter()
+        for i in range(self.n_particles):
+            # Keep particle within bounds
+            self.positions[i] = np.clip(self.positions[i], self.bounds[0], self.bounds[1])
             
-            # Update inertia weight (optional linear decay)
-            w = self.w - (self.w - 0.4) * (iteration / self.max_iter)
+            # Evaluate fitness
+            fitness = self.fitness[i] = self.obj_func(self.positions[i])
             
-            # Update velocity and position
-            for i in range(self.n_particles):
-                r1, r2 = np.random.rand(self.dim), np.random.rand(self.dim)
-                cognitive = self.c1 * r1 * (self.pbest_positions[i] - self.positions[i])
-                social = self.c2 * r2 * (self.gbest_position - self.positions[i])
-                self.velocities[i] = w * self.velocities[i] + cognitive + social
-                
-                # Update positions
-                self.positions[i] += self.velocities[i]
+            # Update personal best
+            if fitness < self.pbest_scores[i]:
+                self.pbest_scores[i] = fitness
+                self.pbest_positions[i] = self.positions[i].copy()
             
-            print(f"Iteration {iteration+1}/{self.max_iter}, Best Fitness: {self.gbest_score:.6f}")
+            # Update global best
+            if fitness < self.gbest_score:
+                self.gbest_score = fitness
+                self.gbest_position = self.positions[i].copy()
+        self.scored_positions = self.positions.copy()
+        t1 = time.perf_counter()
         
-        return self.gbest_position, self.gbest_score
+        # Update inertia weight (optional linear decay)
+        w = self.w - (self.w - 0.4) * (iteration / self.max_iter)
+        
+        # Update velocity and position
+        r = self.rng.random((self.n_particles, 2, self.dim))
+        for i in range(self.n_particles):
+            r1, r2 = r[i]
+            cognitive = self.c1 * r1 * (self.pbest_positions[i] - self.positions[i])
+            social = self.c2 * r2 * (self.gbest_position - self.positions[i])
+            self.velocities[i] = w * self.velocities[i] + cognitive + social
+            
+            # Update positions
+            self.positions[i] += self.velocities[i]
+        
+        self.phase_times = (t1 - t0, time.perf_counter() - t1)
+
+    # ---- Vectorized engine ----
+    # Draws the same random block as the loop above, so both paths give
+    # identical results for the same seed.
+    def _tell(self, fitness, iteration):
+        # Update personal bests
+        improved = fitness < self.pbest_scores
+        self.pbest_scores = np.where(improved, fitness, self.pbest_scores)
+        self.pbest_positions = np.where(improved[:, None], self.positions, self.pbest_positions)
+        
+        # Update global best (argmin picks the first minimum, like the loop)
+        best = np.argmin(fitness)
+        if fitness[best] < self.gbest_score:
+            self.gbest_score = fitness[best]
+            self.gbest_position = self.positions[best].copy()
+        
+        # Update inertia weight (optional linear decay)
+        w = self.w - (self.w - 0.4) * (iteration / self.max_iter)
+        
+        # Update velocity and position; r1/r2 interleaved per particle
+        r = self.rng.random((self.n_particles, 2, self.dim))
+        self.velocities = (w * self.velocities
+                           + self.c1 * r[:, 0] * (self.pbest_positions - self.positions)
+                           + self.c2 * r[:, 1] * (self.gbest_position - self.positions))
+        self.positions = self.positions + self.velocities
 
 
 # Main Function
@@ -1,6 +1,9 @@
+import time
 import numpy as np
 import math
-import random
+from operators import as_generator
+from operators.sampling import AliasTable
+from operators.selection import sus_selection
 
 # ---- Objective Function ----
 # Example: maximize f(x) = x * sin(10πx) + 1.0, where 0 ≤ x ≤ 1
@@ -13,56 +16,96 @@ GENS = 30             # number of generations
 CROSS_RATE = 0.8      # probability of crossover
 MUT_RATE = 0.1        # probability of mutation
 X_BOUND = [0, 1]      # range of x values
+SELECTION = "roulette"  # "roulette" or "sus" (Stochastic Universal Sampling)
 
 # ---- Helper Functions ----
-def init_population(size):
-    return np.random.uniform(X_BOUND[0], X_BOUND[1], size)
+# Random functions take `rng`, a numpy.random.Generator (see operators/_rng.py)
+def init_population(size, rng=None):
+    return as_generator(rng).uniform(X_BOUND[0], X_BOUND[1], size)
 
-def get_fitness(pop):
+def get_fitness(pop, evaluator=None):
+    # evaluator: optional Evaluation.py evaluator to spread the calls over workers
+    if evaluator is not None:
+        return evaluator(pop)
     return np.array([fitness_function(x) for x in pop])
 
-def select(pop, fitness):
-    # Roulette Wheel Selection
-    probs = fitness / np.sum(fitness)
-    return np.random.choice(pop, size=len(pop), p=probs)
+def select(pop, fitness, rng=None):
+    rng = as_generator(rng)
+    if SELECTION == "sus":
+        return pop[sus_selection(fitness, len(pop), start=rng.uniform(0, 1 / len(pop)))]
+    # Roulette Wheel Selection: one alias table per generation, O(1) per draw
+    return pop[AliasTable(fitness).lookup(rng.random(len(pop)))]
 
-def crossover(parent, pop):
-    if np.random.rand() < CROSS_RATE:
-        mate = np.random.choice(pop)
-        alpha = np.random.rand()
+# crossover() and mutate() get their random numbers from next_generation(),
+# which draws them for the whole generation in one block
+def crossover(parent, mate, alpha, u):
+    if u < CROSS_RATE:
         child = alpha * parent + (1 - alpha) * mate
         return np.clip(child, X_BOUND[0], X_BOUND[1])
     return parent
 
-def mutate(child):
-    if np.random.rand() < MUT_RATE:
-        child += np.random.normal(0, 0.1)
+def mutate(child, u, noise):
+    if u < MUT_RATE:
+        child += noise
     return np.clip(child, X_BOUND[0], X_BOUND[1])
 
+def next_generation(pop, fitness, rng=None):
+    # Selection → Crossover → Mutation
+    rng = as_generator(rng)
+    pop = select(pop, fitness, rng)
+    n = len(pop)
+    # Per child: crossover draw, mate, blend weight, mutation draw; then noise
+    u = rng.random((n, 4))
+    noise = rng.normal(0, 0.1, n)
+    mates = pop[(u[:, 1] * n).astype(int)]
+    for i in range(n):
+        child = crossover(pop[i], mates[i], u[i, 2], u[i, 0])
+        child = mutate(child, u[i, 3], noise[i])
+        pop[i] = child
+    return pop
+
 # ---- Main GA Function ----
-def genetic_algorithm():
-    pop = init_population(POP_SIZE)
+def genetic_algorithm(evaluator=None, telemetry=None, termination=None, rng=None):
+    # telemetry: optional Telemetry.py recorder; generations are recorded
+    # there instead of printed
+    # termination: optional Termination.py criteria checked every generation
+    # rng: numpy.random.Generator or seed for the whole run
+    rng = as_generator(rng)
+    if termination is not None:
+        termination.start(maximize=True)
+    pop = init_population(POP_SIZE, rng)
     print("Initial Population:", np.round(pop, 4))
+    best_so_far = -np.inf
 
     for gen in range(GENS):
-        fitness = get_fitness(pop)
+        t0 = time.perf_counter()
+        fitness = get_fitness(pop, evaluator)
         best_idx = np.argmax(fitness)
         best_x, best_fit = pop[best_idx], fitness[best_idx]
-        print(f"Generation {gen+1:02d}: Best X = {best_x:.4f}, Fitness = {best_fit:.4f}")
+        best_so_far = max(best_so_far, best_fit)
+        t1 = time.perf_counter()
+        if telemetry is None:
+            print(f"Generation {gen+1:02d}: Best X = {best_x:.4f}, Fitness = {best_fit:.4f}")
 
-        # Selection → Crossover → Mutation
-        pop = select(pop, fitness)
-        pop_copy = pop.copy()
-        for i in range(len(pop)):
-            child = crossover(pop[i], pop_copy)
-            child = mutate(child)
-            pop[i] = child
+        new_pop = next_generation(pop, fitness, rng)
+        t2 = time.perf_counter()
+        evaluated, pop = pop, new_pop
+        stop = termination is not None and termination.check(best_so_far, (gen + 1) * POP_SIZE, evaluated) is not None
+        # the last generation is recorded whether or not the pacing wants it
+        if telemetry is not None and (telemetry.wants() or stop or gen == GENS - 1):
+            telemetry.record(gen + 1, best_so_far, fitness, evaluated, evaluate=t1 - t0, update=t2 - t1)
+        if stop:
+            break
+    if telemetry is not None:
+        telemetry.flush()
 
     # ---- Final Result ----
-    fitness = get_fitness(pop)
+    fitness = get_fitness(pop, evaluator)
     best_idx = np.argmax(fitness)
     best_x, best_fit = pop[best_idx], fitness[best_idx]
     print("\n==== Final Result ====")
+    if termination is not None and termination.reason is not None:
+        print(f"Stopped after {gen+1} generations: {termination.message}")
     print(f"Optimal X = {best_x:.4f}")
     print(f"Maximum Fitness = {best_fit:.4f}")
 
@@ -0,0 +1,230 @@
+import json
+import math
+import time
+import numpy as np
+
+# Per-iteration telemetry for the optimizers (GWO.py, PSO.py, the SIMPLE-GA
+# loop). An optimizer hands each iteration to a Telemetry object, which keeps
+# a sample of them as fixed-size records and passes them in batches to one or
+# more sinks. Records are rows of a NumPy structured array (RECORD_DTYPE), so
+# a batch is written with a single call.
+
+PHASES = ("evaluate", "update")
+
+RECORD_DTYPE = np.dtype([
+    ("iteration", np.int64),
+    ("best", np.float64),          # best score so far
+    ("mean", np.float64),          # mean / std of this iteration's fitness
+    ("std", np.float64),
+    ("diversity", np.float64),     # mean distance to the population centroid
+    ("evaluate_time", np.float64), # wall time (s) of this iteration's phases
+    ("update_time", np.float64),
+    ("elapsed", np.float64),       # wall time (s) since the Telemetry was created
+])
+
+
+def diversity(positions):
+    # Mean Euclidean distance of the rows of `positions` to their centroid;
+    # one temporary the size of `positions`, squared in place
+    positions = np.asarray(positions, dtype=float).reshape(len(positions), -1)
+    d = positions - positions.sum(axis=0) / len(positions)
+    d *= d
+    return np.sqrt(d.sum(axis=1)).sum() / len(positions)
+
+
+# =============================================================
+# Sinks: write(records) receives a structured array of RECORD_DTYPE rows
+# =============================================================
+class RingBufferSink:
+    """Keeps the last `capacity` records in memory; records() returns them oldest first."""
+    def __init__(self, capacity=10000):
+        self._data = np.zeros(capacity, dtype=RECORD_DTYPE)
+        self._count = 0
+
+    def write(self, records):
+        capacity = len(self._data)
+        records = records[-capacity:]
+        idx = (self._count + np.arange(len(records))) % capacity
+        self._data[idx] = records
+        self._count += len(records)
+
+    def records(self):
+        capacity = len(self._data)
+        if self._count <= capacity:
+            return self._data[:self._count].copy()
+        return np.roll(self._data, -(self._count % capacity))
+
+    def close(self):
+        pass
+
+
+class JSONLSink:
+    """Appends one JSON object per record to a text file."""
+    def __init__(self, path):
+        self._file = open(path, "a")
+
+    def write(self, records):
+        names = records.dtype.names
+        lines = (json.dumps({k: (None if v != v else v) for k, v in zip(names, row)}) + "\n"
+                 for row in records.tolist())   # NaN -> null
+        self._file.write("".join(lines))
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+class BinarySink:
+    """Appends the raw records to a file; read them back with read_binary(path)."""
+    def __init__(self, path):
+        self._file = open(path, "ab")
+
+    def write(self, records):
+        records.tofile(self._file)
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+def read_binary(path):
+    return np.fromfile(path, dtype=RECORD_DTYPE)
+
+
+class CallbackSink:
+    """Calls fn(records) with every batch."""
+    def __init__(self, fn):
+        self.fn = fn
+
+    def write(self, records):
+        self.fn(records)
+
+    def close(self):
+        pass
+
+
+# =============================================================
+# Recorder
+# =============================================================
+class Telemetry:
+    """
+    Collects iteration records for a list of sinks.
+
+    every: record one iteration in `every` (the first is always recorded).
+    batch_size: records are buffered and written this many at a time; the
+                rest on flush() / close().
+    budget: largest fraction of the run's wall time telemetry may take
+            (None: no limit). Records are kept at a fixed stride, a multiple
+            of `every` aiming at half the budget (the rest is headroom for
+            the sinks). The first record is cold, so the second comes after
+            a provisional stride estimated from it; the stride is then fixed
+            from the cost of that second record and of the iterations so far,
+            and every later record is exactly one stride after the previous.
+    The caller may also record an iteration wants() declined, e.g. the last
+    one of a run; that does not move the stride.
+    """
+    def __init__(self, sinks=(), every=1, batch_size=256, budget=0.01):
+        self.sinks = [sinks] if hasattr(sinks, "write") else list(sinks)
+        self.every = every
+        self.budget = budget
+        self._buffer = np.zeros(batch_size, dtype=RECORD_DTYPE)
+        self._n = 0
+        self._start = time.perf_counter()
+        self._spent = 0.0   # seconds spent inside record() / flush()
+        self._recording = 0.0   # seconds spent inside record() alone
+        self._cold = 0.0    # seconds the first record took
+        self._calls = 0
+        self._first_call = None
+        self._last = 0      # call number of the last record wants() asked for
+        self._next = 1      # call number of the next record; None: not yet paced
+        self.stride = None  # calls between records once fixed
+        self.n_recorded = 0
+        self.n_skipped = 0
+
+    def wants(self):
+        # Cheap per-iteration check for the caller: record this iteration?
+        self._calls += 1
+        if self._first_call is None:
+            self._first_call = time.perf_counter()
+        elif self._next is None:
+            stride = self.stride
+            if stride is None:
+                stride = self._stride()
+                if self.n_recorded > 1:   # measured on a warm record: fix it
+                    self.stride = stride
+            self._next = self._last + stride
+        if self._calls < self._next:
+            if (self._calls - 1) % self.every == 0:
+                self.n_skipped += 1   # left out to stay within the budget
+            return False
+        self._last = self._calls
+        self._next = None
+        return True
+
+    def _stride(self):
+        # Iterations between records (a multiple of every) at which records
+        # take about budget / 2 of the wall time, from the mean cost of an
+        # iteration so far and of a record, leaving out the cold first one
+        # once there is another
+        if self.budget is None:
+            return self.every
+        loop = time.perf_counter() - self._first_call - self._spent
+        per_call = max(loop, 1e-9) / (self._calls - 1)
+        if self.n_recorded > 1:
+            per_record = (self._recording - self._cold) / (self.n_recorded - 1)
+        else:
+            per_record = self._cold
+        return self.every * max(1, math.ceil(per_record / (0.5 * self.budget * per_call * self.every)))
+
+    def record(self, iteration, best, fitness, positions=None, **phases):
+        """
+        Stores one iteration. fitness: this iteration's scores; positions:
+        the population, for the diversity measure (NaN when omitted);
+        phases: evaluate=seconds, update=seconds.
+        Call when wants() is true, or for an iteration that must be kept
+        regardless (such as the last of a run).
+        """
+        t0 = time.perf_counter()
+        times = tuple(phases.pop(phase, np.nan) for phase in PHASES)
+        if phases:
+            raise ValueError(f"unknown phases {sorted(phases)}; expected {PHASES}")
+        fitness = np.asarray(fitness, dtype=float)
+        mean = fitness.mean()
+        deviation = fitness - mean
+        std = np.sqrt(deviation @ deviation / len(fitness))
+        spread = np.nan if positions is None else diversity(positions)
+        self._buffer[self._n] = (iteration, best, mean, std, spread) + times + (t0 - self._start,)
+        self._n += 1
+        self.n_recorded += 1
+        cost = time.perf_counter() - t0
+        if self.n_recorded == 1:
+            self._cold = cost
+        self._recording += cost
+        self._spent += cost
+        if self._n == len(self._buffer):
+            self.flush()
+
+    def flush(self):
+        if not self._n:
+            return
+        t0 = time.perf_counter()
+        batch = self._buffer[:self._n].copy()
+        self._n = 0
+        for sink in self.sinks:
+            sink.write(batch)
+        self._spent += time.perf_counter() - t0
+
+    def overhead(self):
+        # Fraction of the wall time so far spent on telemetry
+        return self._spent / max(time.perf_counter() - self._start, 1e-12)
+
+    def close(self):
+        self.flush()
+        for sink in self.sinks:
+            sink.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
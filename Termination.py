@@ -0,0 +1,85 @@
+import time
+
+from Telemetry import diversity
+
+# Early stopping shared by GWO.py, PSO.py and the SIMPLE-GA loop. An optimizer
+# calls start() before its first iteration and check() after every iteration;
+# check() returns None to continue or the reason to stop, which is also kept
+# in .reason ("max_iter" when the optimizer simply ran out of iterations).
+#
+# Every check is O(1) except the diversity one, which is O(pop * dim) and so
+# only runs every `diversity_every` iterations.
+
+REASONS = ("target", "stall", "diversity", "time", "evals", "max_iter")
+
+
+class Termination:
+    """
+    Stopping criteria; any criterion left as None is disabled.
+
+    target: stop once the best score reaches this value
+    stall: stop when the best score has not improved by more than `tol`
+           for this many consecutive iterations
+    min_diversity: stop when the population's mean distance to its centroid
+                   drops below this value
+    time_budget: stop after this many seconds of wall time
+    max_evals: stop once this many objective evaluations have been made
+    """
+    def __init__(self, target=None, stall=None, tol=0.0, min_diversity=None, diversity_every=1,
+                 time_budget=None, max_evals=None):
+        self.target = target
+        self.stall = stall
+        self.tol = tol
+        self.min_diversity = min_diversity
+        self.diversity_every = diversity_every
+        self.time_budget = time_budget
+        self.max_evals = max_evals
+        self.start()
+
+    def start(self, maximize=False):
+        # Resets the clock and the stall window; maximize: higher scores are better
+        self.maximize = maximize
+        self.reason = None
+        self.message = ""
+        self.iterations = 0
+        self._start = time.perf_counter()
+        self._best = None
+        self._since_improvement = 0
+
+    def check(self, best, n_evals=0, positions=None):
+        """
+        Called once per iteration with the best score so far, the number of
+        evaluations so far and (for the diversity criterion) the population.
+        Returns the reason to stop, or None.
+        """
+        self.iterations += 1
+        score = -best if self.maximize else best   # lower is better from here on
+
+        if self.target is not None and score <= (-self.target if self.maximize else self.target):
+            return self._stop("target", f"best score {best:.6g} reached the target {self.target:.6g}")
+
+        if self._best is None or score < self._best - self.tol:
+            self._best = score
+            self._since_improvement = 0
+        else:
+            self._since_improvement += 1
+        if self.stall is not None and self._since_improvement >= self.stall:
+            return self._stop("stall", f"best score did not improve for {self.stall} iterations")
+
+        if (self.min_diversity is not None and positions is not None
+                and self.iterations % self.diversity_every == 0):
+            spread = diversity(positions)
+            if spread < self.min_diversity:
+                return self._stop("diversity", f"population diversity {spread:.3g} fell below {self.min_diversity:.3g}")
+
+        if self.time_budget is not None and time.perf_counter() - self._start >= self.time_budget:
+            return self._stop("time", f"time budget of {self.time_budget:g} s used")
+
+        if self.max_evals is not None and n_evals >= self.max_evals:
+            return self._stop("evals", f"{n_evals} evaluations reached the limit of {self.max_evals}")
+        return None
+
+    def _stop(self, reason, message):
+        self.reason = reason
+        self.message = message
+        return reason
@@ -0,0 +1,20 @@
+"""
+Genetic-algorithm operators with no console I/O.
+
+Crossover operators return the two children, mutation operators return the
+mutated chromosome and selection operators return population indices. The
+real-coded kernels in real.py work on whole (n, dim) matrices at once. Every
+random operator takes an optional ``rng`` (a numpy.random.Generator or a seed).
+The interactive menus live in Crossover.py, Mutation.py and Selection.py.
+"""
+from ._rng import as_generator
+from .crossover import (single_point_crossover, two_point_crossover, uniform_crossover,
+                        arithmetic_crossover, half_uniform_crossover)
+from .mutation import flipping, interchanging, reversing
+from .real import (whole_arithmetic_crossover, blx_alpha_crossover, sbx_crossover,
+                   polynomial_mutation, gaussian_mutation)
+from .sampling import AliasTable, CumulativeTable, roulette_table, rank_table
+from .selection import (roulette_wheel_selection, rank_selection, tournament_selection,
+                        sus_selection, elitism_selection, steady_state_selection,
+                        canonical_selection)
+from .survivor import top_k, bottom_k, replace_worst, SteadyStatePopulation
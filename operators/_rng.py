@@ -0,0 +1,8 @@
+import numpy as np
+
+
+def as_generator(rng=None):
+    # Accept a Generator, a seed (int / SeedSequence) or None (fresh entropy)
+    if isinstance(rng, np.random.Generator):
+        return rng
+    return np.random.default_rng(rng)
@@ -0,0 +1,65 @@
+import numpy as np
+from ._rng import as_generator
+
+
+def _like(parent, genes):
+    # Rebuild a child with the parent's type (bit string or list)
+    return "".join(genes) if isinstance(parent, str) else list(genes)
+
+
+# =============================================================
+# 1. Single Point Crossover
+# =============================================================
+def single_point_crossover(p1, p2, rng=None):
+    rng = as_generator(rng)
+    point = int(rng.integers(1, len(p1) - 2, endpoint=True))
+    c1 = _like(p1, list(p1[:point]) + list(p2[point:]))
+    c2 = _like(p2, list(p2[:point]) + list(p1[point:]))
+    return c1, c2
+
+
+# =============================================================
+# 2. Two Point Crossover
+# =============================================================
+def two_point_crossover(p1, p2, rng=None):
+    rng = as_generator(rng)
+    point1 = int(rng.integers(1, len(p1) - 3, endpoint=True))
+    point2 = int(rng.integers(point1 + 1, len(p1) - 2, endpoint=True))
+    c1 = _like(p1, list(p1[:point1]) + list(p2[point1:point2]) + list(p1[point2:]))
+    c2 = _like(p2, list(p2[:point1]) + list(p1[point1:point2]) + list(p2[point2:]))
+    return c1, c2
+
+
+# =============================================================
+# 3. Uniform Crossover
+# =============================================================
+def uniform_crossover(p1, p2, rng=None):
+    rng = as_generator(rng)
+    mask = rng.integers(0, 2, len(p1))
+    c1 = _like(p1, (b if m else a for a, b, m in zip(p1, p2, mask)))
+    c2 = _like(p2, (a if m else b for a, b, m in zip(p1, p2, mask)))
+    return c1, c2
+
+
+# =============================================================
+# 4. Arithmetic Crossover (real-valued parents)
+# =============================================================
+def arithmetic_crossover(p1, p2, alpha=None, rng=None):
+    # c1 = a*p1 + (1-a)*p2, c2 = (1-a)*p1 + a*p2; a drawn in [0, 1) if not given
+    if alpha is None:
+        alpha = as_generator(rng).random()
+    p1, p2 = np.asarray(p1, dtype=float), np.asarray(p2, dtype=float)
+    return alpha * p1 + (1 - alpha) * p2, (1 - alpha) * p1 + alpha * p2
+
+
+# =============================================================
+# 5. Half Uniform Crossover (HUX)
+# =============================================================
+def half_uniform_crossover(p1, p2, rng=None):
+    rng = as_generator(rng)
+    diff_positions = [i for i in range(len(p1)) if p1[i] != p2[i]]
+    swapped = rng.permutation(diff_positions)[:len(diff_positions) // 2]
+    c1, c2 = list(p1), list(p2)
+    for pos in swapped:
+        c1[pos], c2[pos] = c2[pos], c1[pos]
+    return _like(p1, c1), _like(p2, c2)
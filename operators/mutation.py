@@ -0,0 +1,23 @@
+from ._rng import as_generator
+
+_FLIPPED = {'0': '1', '1': '0'}
+
+
+# ----- Flipping Mutation -----
+def flipping(chromosome, rate=0.1, rng=None):
+    flips = as_generator(rng).random(len(chromosome)) < rate
+    return "".join(_FLIPPED[bit] if flip else bit for bit, flip in zip(chromosome, flips))
+
+
+# ----- Interchanging Mutation -----
+def interchanging(chromosome, rng=None):
+    i, j = as_generator(rng).choice(len(chromosome), 2, replace=False)
+    chromo_list = list(chromosome)
+    chromo_list[i], chromo_list[j] = chromo_list[j], chromo_list[i]
+    return ''.join(chromo_list)
+
+
+# ----- Reversing Mutation -----
+def reversing(chromosome, rng=None):
+    i, j = sorted(as_generator(rng).choice(len(chromosome), 2, replace=False))
+    return chromosome[:i] + chromosome[i:j][::-1] + chromosome[j:]
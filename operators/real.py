@@ -0,0 +1,146 @@
+import numpy as np
+from ._rng import as_generator
+
+# Real-coded operators on (n, dim) float matrices. Crossover kernels pair row
+# i of p1 with row i of p2 and return two (n, dim) child matrices; mutation
+# kernels return a mutated copy. bounds is (low, high), each a scalar or a
+# per-dimension array, as taken by GreyWolfOptimizer / ParticleSwarmOptimizer;
+# children are clipped to it when given.
+#
+# Every kernel takes an optional out=: a (c1, c2) pair of float64 arrays for
+# the crossovers (not overlapping the parents), one array for the mutations
+# (which may be `pop` itself, to mutate in place). The children are written
+# there and returned, so a GA can breed straight into a preallocated buffer.
+
+
+def _clip(x, bounds):
+    return x if bounds is None else np.clip(x, bounds[0], bounds[1], out=x)
+
+
+def _children(out, shape):
+    return (np.empty(shape), np.empty(shape)) if out is None else out
+
+
+def _mutable(pop, out):
+    # The array a mutation kernel writes: a copy of pop, or out holding pop
+    if out is None:
+        return np.array(pop, dtype=float)
+    if out is not pop:
+        out[...] = pop
+    return out
+
+
+def _mutation_sites(shape, rate, rng):
+    # (rows, cols) of the genes that mutate, each independently with
+    # probability rate. The gaps between successive sites (in flat order) are
+    # geometric, so about rate * size numbers are drawn instead of a uniform
+    # per gene.
+    size = shape[0] * shape[1]
+    if rate <= 0 or size == 0:
+        return np.divmod(np.empty(0, dtype=np.intp), max(shape[1], 1))
+    chunk = int(size * rate + 4 * np.sqrt(size * rate)) + 16
+    sites = np.cumsum(rng.geometric(min(rate, 1.0), chunk)) - 1
+    while sites[-1] < size:
+        more = np.cumsum(rng.geometric(min(rate, 1.0), chunk))
+        more += sites[-1]
+        sites = np.concatenate((sites, more))
+    return np.divmod(sites[:np.searchsorted(sites, size)], shape[1])
+
+
+# ----- Whole Arithmetic Crossover -----
+def whole_arithmetic_crossover(p1, p2, bounds=None, rng=None, out=None):
+    # c1 = a*p1 + (1-a)*p2, c2 = (1-a)*p1 + a*p2 with one a in [0, 1) per pair
+    p1, p2 = np.asarray(p1, dtype=float), np.asarray(p2, dtype=float)
+    a = as_generator(rng).random((len(p1), 1))
+    c1, c2 = _children(out, p1.shape)
+    step = np.subtract(p1, p2, out=c2)
+    step *= a
+    np.add(p2, step, out=c1)
+    np.subtract(p1, step, out=c2)
+    return _clip(c1, bounds), _clip(c2, bounds)
+
+
+# ----- BLX-alpha Crossover -----
+def blx_alpha_crossover(p1, p2, alpha=0.5, bounds=None, rng=None, out=None):
+    # Each gene drawn uniformly from [min - alpha*d, max + alpha*d], d = |p1 - p2|
+    p1, p2 = np.asarray(p1, dtype=float), np.asarray(p2, dtype=float)
+    rng = as_generator(rng)
+    c1, c2 = _children(out, p1.shape)
+    width = np.subtract(p1, p2)
+    np.abs(width, out=width)
+    low = np.minimum(p1, p2)
+    low -= alpha * width
+    width *= 1 + 2 * alpha
+    for child in (c1, c2):
+        rng.random(out=child)
+        child *= width
+        child += low
+    return _clip(c1, bounds), _clip(c2, bounds)
+
+
+# ----- Simulated Binary Crossover (SBX) -----
+def sbx_crossover(p1, p2, eta=15.0, bounds=None, rng=None, out=None):
+    """
+    Deb & Agrawal's SBX: children spread symmetrically around the parents'
+    mean by a factor beta whose distribution is controlled by eta (larger
+    eta keeps children closer to their parents).
+    """
+    p1, p2 = np.asarray(p1, dtype=float), np.asarray(p2, dtype=float)
+    c1, c2 = _children(out, p1.shape)
+    # beta (in c2) from uniforms u (in c1): 2u for u <= 0.5, else 1 / (2(1 - u))
+    u = as_generator(rng).random(out=c1)
+    beta = np.subtract(1, u, out=c2)
+    beta *= 2
+    np.reciprocal(beta, out=beta)
+    np.multiply(u, 2, out=beta, where=u <= 0.5)
+    beta **= 1 / (eta + 1)
+    # c1, c2 = mean +- half, half = 0.5 * beta * (p1 - p2)
+    half = beta
+    half *= 0.5
+    diff = np.subtract(p1, p2)
+    half *= diff
+    mean = np.add(p1, p2, out=c1)
+    mean *= 0.5
+    np.subtract(mean, half, out=diff)
+    mean += half
+    c2[...] = diff
+    return _clip(c1, bounds), _clip(c2, bounds)
+
+
+# ----- Polynomial Mutation -----
+def polynomial_mutation(pop, bounds, eta=20.0, rate=None, rng=None, out=None):
+    """
+    Deb's bounded polynomial mutation: each gene mutates with probability
+    rate (default 1/dim) by a perturbation that never leaves [low, high];
+    larger eta gives smaller steps.
+    """
+    pop = _mutable(pop, out)
+    rng = as_generator(rng)
+    rate = 1.0 / pop.shape[-1] if rate is None else rate
+    low, high = (np.broadcast_to(np.asarray(b, dtype=float), pop.shape) for b in bounds)
+    # Only the mutating genes are drawn and computed (about rate * pop.size of them)
+    rows, cols = _mutation_sites(pop.shape, rate, rng)
+    x, lo, hi = pop[rows, cols], low[rows, cols], high[rows, cols]
+    span = hi - lo
+    u = rng.random(len(x))
+    left = u < 0.5
+    # normalised distance to the bound on the side being moved towards
+    room = np.where(left, x - lo, hi - x) / span
+    power = (1 - room) ** (eta + 1)
+    val = np.where(left, 2 * u + (1 - 2 * u) * power, 2 * (1 - u) + 2 * (u - 0.5) * power)
+    root = val ** (1 / (eta + 1))
+    delta = np.where(left, root - 1, 1 - root)
+    pop[rows, cols] = np.clip(x + delta * span, lo, hi)
+    return pop
+
+
+# ----- Gaussian Mutation -----
+def gaussian_mutation(pop, sigma=0.1, rate=None, bounds=None, rng=None, out=None):
+    # Adds N(0, sigma) to each gene with probability rate (default 1/dim);
+    # sigma may be per-dimension
+    pop = _mutable(pop, out)
+    rng = as_generator(rng)
+    rate = 1.0 / pop.shape[-1] if rate is None else rate
+    rows, cols = _mutation_sites(pop.shape, rate, rng)
+    pop[rows, cols] += rng.standard_normal(len(rows)) * np.broadcast_to(sigma, pop.shape)[rows, cols]
+    return _clip(pop, bounds)
@@ -0,0 +1,89 @@
+import numpy as np
+from ._rng import as_generator
+
+# Fitness-proportional sampling tables. Build one table per generation, then
+# draw any number of parent indices from it:
+#   AliasTable       Walker/Vose alias method, O(1) per draw
+#   CumulativeTable  cumulative sum + searchsorted, O(log n) per draw
+# Both are built without Python-level loops and return integer indices.
+
+
+class CumulativeTable:
+    def __init__(self, weights):
+        weights = np.asarray(weights, dtype=float)
+        self.cdf = np.cumsum(weights)
+        if not self.cdf[-1] > 0:
+            raise ValueError("weights must have a positive sum")
+
+    def __len__(self):
+        return len(self.cdf)
+
+    def lookup(self, u):
+        # Map uniforms in [0, 1) to indices; side='right' skips zero weights
+        index = np.searchsorted(self.cdf, np.asarray(u) * self.cdf[-1], side="right")
+        return np.minimum(index, len(self.cdf) - 1)
+
+    def sample(self, size, rng=None):
+        return self.lookup(as_generator(rng).random(size))
+
+
+class AliasTable:
+    def __init__(self, weights):
+        weights = np.asarray(weights, dtype=float)
+        total = weights.sum()
+        if not total > 0:
+            raise ValueError("weights must have a positive sum")
+        n = len(weights)
+        q = weights * (n / total)
+        self.prob = np.ones(n)
+        self.alias = np.arange(n)
+
+        small = np.flatnonzero(q < 1.0)
+        large = np.flatnonzero(q >= 1.0)
+        if len(small) and len(large):
+            # Vose's pairing, vectorized: the larges are consumed in order, so
+            # small i is topped up by the first large whose cumulative excess
+            # E covers the deficit accumulated before i, and a large becomes
+            # "small" (topped up by the next large) once the running deficit
+            # D passes its own E.
+            deficit = 1.0 - q[small]
+            D = np.cumsum(deficit)
+            E = np.cumsum(q[large] - 1.0)
+            owner = np.searchsorted(E, D - deficit, side="left")
+            self.prob[small] = q[small]
+            self.alias[small] = large[np.minimum(owner, len(large) - 1)]
+
+            spent = np.searchsorted(D, E[:-1], side="right")
+            k = np.flatnonzero(spent < len(small))
+            self.prob[large[k]] = np.clip(1.0 - (D[spent[k]] - E[k]), 0.0, 1.0)
+            self.alias[large[k]] = large[k + 1]
+
+    def __len__(self):
+        return len(self.prob)
+
+    def lookup(self, u):
+        # One uniform per draw: integer part picks the column, fraction the coin
+        u = np.asarray(u) * len(self.prob)
+        column = np.minimum(u.astype(np.intp), len(self.prob) - 1)
+        return np.where(u - column < self.prob[column], column, self.alias[column])
+
+    def sample(self, size, rng=None):
+        return self.lookup(as_generator(rng).random(size))
+
+
+TABLES = {"alias": AliasTable, "cumsum": CumulativeTable}
+
+
+def rank_weights(fitness):
+    # Rank 1 for the worst ... n for the best, with a single sort
+    ranks = np.empty(len(fitness))
+    ranks[np.argsort(fitness, kind="stable")] = np.arange(1, len(fitness) + 1)
+    return ranks
+
+
+def roulette_table(fitness, method="alias"):
+    return TABLES[method](fitness)
+
+
+def rank_table(fitness, method="alias"):
+    return TABLES[method](rank_weights(fitness))
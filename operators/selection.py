@@ -0,0 +1,124 @@
+import numpy as np
+from ._rng import as_generator
+from .sampling import roulette_table, rank_table
+from .survivor import top_k, bottom_k
+
+# All selectors take a fitness array (higher is better) and return integer
+# indices into the population; use population[indices] to pick individuals.
+
+
+# ----- 1. Roulette Wheel Selection -----
+# method: "alias" (O(1) per draw) or "cumsum" (O(log n) per draw), see sampling.py
+def roulette_wheel_selection(fitness, n_select=4, rng=None, method="alias"):
+    return roulette_table(fitness, method).sample(n_select, rng)
+
+
+# ----- 2. Rank Selection -----
+def rank_selection(fitness, n_select=4, rng=None, method="alias"):
+    return rank_table(fitness, method).sample(n_select, rng)
+
+
+# ----- 3. Tournament Selection -----
+def _has_duplicate(contenders):
+    k = contenders.shape[1]
+    if k > 8:
+        return (np.diff(np.sort(contenders, axis=1), axis=1) == 0).any(axis=1)
+    # Small tournaments: pairwise column compares beat a row-wise sort
+    clash = np.zeros(len(contenders), dtype=bool)
+    for i in range(k):
+        for j in range(i + 1, k):
+            clash |= contenders[:, i] == contenders[:, j]
+    return clash
+
+
+def _contenders(n, k, n_select, replace, rng):
+    # (n_select, k) matrix of contender indices, one tournament per row
+    if replace:
+        return rng.integers(0, n, (n_select, k))
+    if k * k <= n:
+        # Draw with replacement and redraw only the rows holding a duplicate
+        contenders = rng.integers(0, n, (n_select, k))
+        clash = np.flatnonzero(_has_duplicate(contenders))
+        while len(clash):
+            contenders[clash] = rng.integers(0, n, (len(clash), k))
+            clash = clash[_has_duplicate(contenders[clash])]
+        return contenders
+    if 2 * k <= n:
+        # Large tournaments: redraw only the duplicated entries, so memory
+        # and time stay O(k) per row
+        contenders = rng.integers(0, n, (n_select, k))
+        rows = np.arange(n_select)
+        while len(rows):
+            block = contenders[rows]
+            order = np.argsort(block, axis=1)
+            ranked = np.take_along_axis(block, order, axis=1)
+            r, c = np.nonzero(ranked[:, 1:] == ranked[:, :-1])
+            block[r, order[r, c + 1]] = rng.integers(0, n, len(r))
+            contenders[rows] = block
+            rows = rows[np.unique(r)]
+        return contenders
+    # k > n/2: the k smallest of n random keys per row; n < 2k here, so the
+    # rows are still O(k) wide
+    return np.argpartition(rng.random((n_select, n)), k - 1, axis=1)[:, :k]
+
+
+def tournament_selection(fitness, k=2, n_select=4, rng=None, replace=False, p_win=1.0):
+    """
+    Runs n_select tournaments of size k at once and returns the winners.
+    replace: allow the same individual twice in one tournament
+    p_win:   probability the best contender wins; below 1 the i-th best wins
+             with probability p_win * (1 - p_win)**i (the last takes the rest)
+    """
+    rng = as_generator(rng)
+    fitness = np.asarray(fitness)
+    contenders = _contenders(len(fitness), k, n_select, replace, rng)
+    scores = fitness[contenders]
+    rows = np.arange(n_select)
+    if p_win >= 1.0:
+        return contenders[rows, np.argmax(scores, axis=1)]
+    ranked = np.argsort(-scores, axis=1, kind="stable")
+    place = np.minimum(rng.geometric(p_win, n_select) - 1, k - 1)
+    return contenders[rows, ranked[rows, place]]
+
+
+# ----- 4. Stochastic Universal Sampling (SUS) -----
+def sus_selection(fitness, n_select=4, rng=None, start=None):
+    """
+    n_select equally spaced pointers from one random offset, mapped to
+    individuals in a single searchsorted call. Pointers are placed on the
+    unnormalized cumulative fitness and the result is clamped to the last
+    index, so float round-off at the end of the cumsum cannot overrun.
+    start: optional pre-drawn offset in [0, 1/n_select).
+    """
+    cum_fit = np.cumsum(np.asarray(fitness, dtype=float))
+    if start is None:
+        start = as_generator(rng).uniform(0, 1 / n_select)
+    points = (start + np.arange(n_select) / n_select) * cum_fit[-1]
+    return np.minimum(np.searchsorted(cum_fit, points, side="left"), len(cum_fit) - 1)
+
+
+# ----- 5. Elitism Selection -----
+def elitism_selection(fitness, elite_size=2):
+    return top_k(fitness, elite_size)
+
+
+# ----- 6. Steady-State Selection -----
+def steady_state_selection(fitness, num_replace=2):
+    """
+    Splits the population into survivors (in population order) and the
+    worst 'num_replace' individuals that offspring should replace.
+    Returns (survivor_indices, replaced_indices).
+    To replace in place, see survivor.replace_worst / SteadyStatePopulation.
+    """
+    replaced = bottom_k(fitness, num_replace)
+    keep = np.ones(len(fitness), dtype=bool)
+    keep[replaced] = False
+    return np.flatnonzero(keep), replaced
+
+
+# ----- 7. Canonical (Deterministic) Selection -----
+def canonical_selection(fitness, n_select=4):
+    """
+    Selects the top n_select individuals with highest fitness deterministically.
+    """
+    return top_k(fitness, n_select)
@@ -0,0 +1,79 @@
+import heapq
+import numpy as np
+
+# Survivor selection with partial sorts: np.argpartition finds the k best or
+# worst in O(N) and only those k are ordered. Fitness is higher-is-better.
+
+
+def top_k(fitness, k, ordered=True):
+    # Indices of the k fittest individuals (best first when ordered)
+    fitness = np.asarray(fitness)
+    k = min(k, len(fitness))
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    best = np.argpartition(fitness, len(fitness) - k)[len(fitness) - k:]
+    if ordered:
+        best = best[np.argsort(fitness[best], kind="stable")[::-1]]
+    return best
+
+
+def bottom_k(fitness, k, ordered=False):
+    # Indices of the k least fit individuals (worst first when ordered)
+    fitness = np.asarray(fitness)
+    k = min(k, len(fitness))
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    worst = np.argpartition(fitness, k - 1)[:k]
+    if ordered:
+        worst = worst[np.argsort(fitness[worst], kind="stable")]
+    return worst
+
+
+def replace_worst(population, fitness, offspring, offspring_fitness):
+    """
+    Steady-state replacement in place: the len(offspring) worst rows of the
+    preallocated population/fitness arrays are overwritten with the offspring.
+    Returns the replaced indices.
+    """
+    worst = bottom_k(fitness, len(offspring))
+    population[worst] = offspring
+    fitness[worst] = offspring_fitness
+    return worst
+
+
+class SteadyStatePopulation:
+    """
+    Population for steady-state GAs doing many single replacements.
+
+    A min-heap of (fitness, index) keeps the current worst individual at the
+    root, so each replace() costs O(log N) instead of re-ranking the whole
+    population. population and fitness are updated in place.
+    """
+    def __init__(self, population, fitness):
+        self.population = population
+        self.fitness = np.asarray(fitness, dtype=float)
+        self._heap = [(f, i) for i, f in enumerate(self.fitness.tolist())]
+        heapq.heapify(self._heap)
+        self.best_index = int(np.argmax(self.fitness))
+
+    def worst(self):
+        return self._heap[0][1]
+
+    def replace(self, individual, fit, only_if_better=True):
+        # Put one offspring in place of the current worst; returns its index,
+        # or None when it is rejected for not beating the worst
+        worst_fit, index = self._heap[0]
+        if only_if_better and fit <= worst_fit:
+            return None
+        self.population[index] = individual
+        self.fitness[index] = fit
+        heapq.heapreplace(self._heap, (fit, index))
+        if index == self.best_index:
+            # Only when the worst was also the best (flat population)
+            self.best_index = int(np.argmax(self.fitness))
+        elif fit > self.fitness[self.best_index]:
+            self.best_index = index
+        return index
+
+    def elites(self, k):
+        return top_k(self.fitness, k)